@@ -12,6 +12,14 @@ Example:
     Output: [0, 1]
 """
 
+import time
+from collections.abc import Iterable
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, only two_sum_numpy needs it
+    np = None
+
 """
 def two_sum(nums: list[int], target: int) -> list[int]:
     # Brute force implementation. 
@@ -70,4 +78,121 @@ def two_sum(nums: list[int], target: int) -> list[int]:
         if needed_complement in seen_num:
             return [seen_num[needed_complement], i]
         seen_num[num] = i
-    return []
\ No newline at end of file
+    return []
+
+def two_sum_numpy(nums, target: int) -> list[int]:
+    """
+    Vectorized two_sum for large integer arrays (ndarray, array('q') or list).
+
+    Sort once with argsort, then binary search every complement at the same
+    time with searchsorted. No Python int or dict entry per element.
+    Time complexity: O(n log n)
+    Space complexity: O(n) machine words
+
+    Values are taken as int64, so target - num must fit in int64.
+
+    Args:
+        nums: one dimensional integer array-like.
+        target (int): value the pair must sum to.
+
+    Returns:
+        list[int]: the original indices [i, j] with i < j, or [].
+    """
+    if np is None:
+        raise ImportError("two_sum_numpy requires numpy")
+    values = np.asarray(nums, dtype=np.int64)
+    n = values.size
+    if n < 2:
+        return []
+    order = np.argsort(values, kind="stable")
+    sorted_values = values[order]
+    complements = target - sorted_values
+    pos = np.searchsorted(sorted_values, complements, side="left")
+    # The complement may be the element itself, use the next equal one then.
+    pos += pos == np.arange(n)
+    found = pos < n
+    pos[~found] = n - 1
+    found &= sorted_values[pos] == complements
+    hits = np.flatnonzero(found)
+    if hits.size == 0:
+        return []
+    k = hits[0]
+    return sorted([int(order[k]), int(order[pos[k]])])
+
+
+# Implementations selectable by name, all with the two_sum signature.
+BACKENDS = {"dict": two_sum}
+if np is not None:
+    BACKENDS["numpy"] = two_sum_numpy
+
+
+class TwoSumIndex:
+    """
+    Reusable two_sum index over a fixed `nums` list.
+
+    two_sum rebuilds `seen_num` on every call. When the same `nums` is
+    queried with many targets, build the value -> first index map once and
+    only pay for the scan on each query.
+    Build: O(n), Query: O(n) worst case with early exit, no allocation.
+
+    Build and query cost (seconds) are kept in `build_seconds`,
+    `query_seconds` and `queries`, see `stats()`.
+    """
+
+    def __init__(self, nums: list[int]):
+        start = time.perf_counter()
+        self.nums = nums
+        # Walking backwards leaves the first index of each value in the map.
+        self.first_index = {
+            num: i for i, num in zip(range(len(nums) - 1, -1, -1), reversed(nums))
+        }
+        self.build_seconds = time.perf_counter() - start
+        self.query_seconds = 0.0
+        self.queries = 0
+
+    def query(self, target: int) -> list[int]:
+        """
+        Returns the indices of the two numbers that sum to target,
+        same answer as two_sum(nums, target) up to the choice of the
+        first index.
+
+        Args:
+            target (int): value the pair must sum to.
+
+        Returns:
+            list[int]: [i, j] with i < j, or [] if there is no pair.
+        """
+        start = time.perf_counter()
+        first_index = self.first_index
+        result = []
+        for j, num in enumerate(self.nums):
+            i = first_index.get(target - num)
+            if i is not None and i < j:
+                result = [i, j]
+                break
+        self.query_seconds += time.perf_counter() - start
+        self.queries += 1
+        return result
+
+    def query_many(self, targets: Iterable[int]) -> list[list[int]]:
+        """
+        Answers two_sum for every target in `targets`.
+
+        Args:
+            targets (Iterable[int]): targets to look up.
+
+        Returns:
+            list[list[int]]: one [i, j] (or []) per target, in order.
+        """
+        return [self.query(target) for target in targets]
+
+    def stats(self) -> dict[str, float]:
+        """Build cost, total query cost and mean cost per query in seconds."""
+        return {
+            "build_seconds": self.build_seconds,
+            "query_seconds": self.query_seconds,
+            "queries": self.queries,
+            "seconds_per_query": (
+                self.query_seconds / self.queries if self.queries else 0.0
+            ),
+        }
@@ -1,21 +1,47 @@
-from solution import two_sum
+import pytest
 
+from solution import BACKENDS, TwoSumIndex, two_sum
 
-def test_basic():
-    assert sorted(two_sum([2, 7, 11, 15], 9)) == [0, 1]
 
+@pytest.fixture(params=sorted(BACKENDS))
+def two_sum_impl(request):
+    return BACKENDS[request.param]
 
-def test_middle_elements():
-    assert sorted(two_sum([3, 2, 4], 6)) == [1, 2]
 
+def test_basic(two_sum_impl):
+    assert sorted(two_sum_impl([2, 7, 11, 15], 9)) == [0, 1]
 
-def test_same_value():
-    assert sorted(two_sum([3, 3], 6)) == [0, 1]
 
+def test_middle_elements(two_sum_impl):
+    assert sorted(two_sum_impl([3, 2, 4], 6)) == [1, 2]
 
-def test_negative_numbers():
-    assert sorted(two_sum([-1, -2, -3, -4, -5], -8)) == [2, 4]
 
+def test_same_value(two_sum_impl):
+    assert sorted(two_sum_impl([3, 3], 6)) == [0, 1]
 
-def test_large_target():
-    assert sorted(two_sum([1, 2, 3, 4, 5], 9)) == [3, 4]
+
+def test_negative_numbers(two_sum_impl):
+    assert sorted(two_sum_impl([-1, -2, -3, -4, -5], -8)) == [2, 4]
+
+
+def test_large_target(two_sum_impl):
+    assert sorted(two_sum_impl([1, 2, 3, 4, 5], 9)) == [3, 4]
+
+
+def test_no_pair(two_sum_impl):
+    assert two_sum_impl([1, 2, 3], 100) == []
+
+
+def test_index_matches_two_sum():
+    nums = [2, 7, 11, 15, -4, 3, 3]
+    index = TwoSumIndex(nums)
+    for target in [9, 18, 26, 6, -1, 7, 100]:
+        assert sorted(index.query(target)) == sorted(two_sum(nums, target))
+
+
+def test_index_query_many():
+    index = TwoSumIndex([3, 2, 4])
+    assert index.query_many([6, 5, 7, 100]) == [[1, 2], [0, 1], [0, 2], []]
+    stats = index.stats()
+    assert stats["queries"] == 4
+    assert stats["build_seconds"] >= 0.0
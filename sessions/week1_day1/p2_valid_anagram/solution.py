@@ -13,8 +13,17 @@ Example:
     Output: False
 """
 
+from collections import Counter
+from collections.abc import Iterator
+from itertools import zip_longest
 
-def is_anagram(s: str, t: str) -> bool:
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, is_anagram_histogram works without it
+    np = None
+
+
+def is_anagram_count_words(s: str, t: str) -> bool:
     """ Given two strings return true if s is a anagram of t
     false otherwise. 
 
@@ -39,14 +48,10 @@ def is_anagram(s: str, t: str) -> bool:
     
     count_s = count_letters_word(s)
     count_t = count_letters_word(t)
-    print(count_s)
-    print(count_t)
     return count_s == count_t
 
 
-from collections import Counter
-
-def is_anagram(s: str, t: str) -> bool:
+def is_anagram_counter(s: str, t: str) -> bool:
     """Implementation of is_anagram with Counter
     from collections
 
@@ -73,5 +78,103 @@ def is_anagram(s: str, t: str) -> bool:
     
     return True 
 
-a = {"test": 0}
-print(a.pop(1, "do not exist"))
\ No newline at end of file
+
+def _byte_histograms_equal(bs: bytes, bt: bytes) -> bool:
+    """Compares the byte histograms of two equal length byte strings."""
+    if np is not None:
+        count_s = np.bincount(np.frombuffer(bs, dtype=np.uint8), minlength=256)
+        count_t = np.bincount(np.frombuffer(bt, dtype=np.uint8), minlength=256)
+        return bool(np.array_equal(count_s, count_t))
+    # bytes.count runs in C, one pass per distinct byte (at most 256).
+    for byte in set(bs):
+        if bs.count(byte) != bt.count(byte):
+            return False
+    return True
+
+
+def is_anagram_histogram(s: str, t: str) -> bool:
+    """
+    is_anagram without per character dict traffic.
+
+    Latin-1 strings (ASCII included) are encoded to bytes, one byte per
+    character, and their byte histograms are compared with numpy bincount
+    (or bytes.count without numpy). Any other string falls back to Counter,
+    which counts in C as well.
+    Time complexity: O(n)
+    Space complexity: O(n) for the encoded copies
+
+    Args:
+        s (str): first word.
+        t (str): second word.
+
+    Returns:
+        bool: True if t is an anagram of s.
+    """
+    if len(s) != len(t):
+        return False
+    try:
+        bs = s.encode("latin-1")
+        bt = t.encode("latin-1")
+    except UnicodeEncodeError:
+        return Counter(s) == Counter(t)
+    return _byte_histograms_equal(bs, bt)
+
+
+def _iter_chunks(source, chunk_size: int) -> Iterator:
+    """Yields fixed size chunks from file-like objects, else iterates source."""
+    read = getattr(source, "read", None)
+    if read is None:
+        yield from source
+        return
+    while chunk := read(chunk_size):
+        yield chunk
+
+
+def is_anagram_stream(s_chunks, t_chunks, chunk_size: int = 1 << 20) -> bool:
+    """
+    is_anagram over two streams of chunks, without materialising either side.
+
+    Each side can be a file object (read in `chunk_size` pieces) or any
+    iterable of str or bytes chunks (generators, mmap slices, socket reads).
+    Both streams are consumed in lockstep into a single signed histogram:
+    s chunks add, t chunks subtract. Memory is one chunk per side plus one
+    counter per distinct symbol.
+    Time complexity: O(n)
+    Space complexity: O(chunk_size + alphabet)
+
+    Bytes chunks count bytes, which matches characters only for single byte
+    encodings. Open UTF-8 files in text mode to compare characters.
+
+    Args:
+        s_chunks: file object or iterable of str/bytes chunks.
+        t_chunks: file object or iterable of chunks of the same type.
+        chunk_size (int): read size used for file objects.
+
+    Returns:
+        bool: True if the concatenated t is an anagram of the concatenated s.
+    """
+    letter_count = Counter()
+    length_diff = 0
+    pairs = zip_longest(
+        _iter_chunks(s_chunks, chunk_size), _iter_chunks(t_chunks, chunk_size)
+    )
+    for s_chunk, t_chunk in pairs:
+        if s_chunk:
+            letter_count.update(s_chunk)
+            length_diff += len(s_chunk)
+        if t_chunk:
+            # Count in C first, then subtract once per distinct symbol.
+            letter_count.subtract(Counter(t_chunk))
+            length_diff -= len(t_chunk)
+    if length_diff != 0:
+        return False
+    return not any(letter_count.values())
+
+
+# Implementations selectable by name, all with the is_anagram signature.
+BACKENDS = {
+    "dict": is_anagram,
+    "count_words": is_anagram_count_words,
+    "counter": is_anagram_counter,
+    "histogram": is_anagram_histogram,
+}
@@ -1,29 +1,70 @@
-from solution import is_anagram
+import io
 
+import pytest
 
-def test_valid_anagram():
+from solution import BACKENDS, is_anagram_stream
+
+
+@pytest.fixture(params=sorted(BACKENDS))
+def is_anagram(request):
+    return BACKENDS[request.param]
+
+
+def test_valid_anagram(is_anagram):
     assert is_anagram("anagram", "nagaram") is True
 
 
-def test_not_anagram():
+def test_not_anagram(is_anagram):
     assert is_anagram("rat", "car") is False
 
 
-def test_different_lengths():
+def test_different_lengths(is_anagram):
     assert is_anagram("ab", "abc") is False
 
 
-def test_empty_strings():
+def test_empty_strings(is_anagram):
     assert is_anagram("", "") is True
 
 
-def test_single_char():
+def test_single_char(is_anagram):
     assert is_anagram("a", "a") is True
 
 
-def test_repeated_chars():
+def test_repeated_chars(is_anagram):
     assert is_anagram("aab", "aba") is True
 
 
-def test_same_chars_different_count():
+def test_same_chars_different_count(is_anagram):
     assert is_anagram("aacc", "ccac") is False
+
+
+def test_latin1(is_anagram):
+    assert is_anagram("café", "éfac") is True
+    assert is_anagram("café", "cafe") is False
+
+
+def test_unicode(is_anagram):
+    assert is_anagram("日本語", "語日本") is True
+    assert is_anagram("日本語", "日本本") is False
+    assert is_anagram("aé日", "日éa") is True
+
+
+def test_stream_generators():
+    s_chunks = (c for c in ["ana", "gr", "am"])
+    t_chunks = (c for c in ["n", "agaram"])
+    assert is_anagram_stream(s_chunks, t_chunks) is True
+    assert is_anagram_stream(["rat"], ["c", "ar"]) is False
+    assert is_anagram_stream([], []) is True
+
+
+def test_stream_different_lengths():
+    assert is_anagram_stream(["ab"], ["ab", "c"]) is False
+
+
+def test_stream_file_objects():
+    s_file = io.StringIO("listen" * 1000)
+    t_file = io.StringIO("silent" * 1000)
+    assert is_anagram_stream(s_file, t_file, chunk_size=7) is True
+    s_file = io.BytesIO(b"aacc")
+    t_file = io.BytesIO(b"ccac")
+    assert is_anagram_stream(s_file, t_file, chunk_size=3) is False
@@ -13,6 +13,402 @@ Example:
     Output: False
 """
 
+import heapq
+import math
+import mmap
+import os
+import tempfile
+from array import array
+from collections import deque
+from collections.abc import Iterable
 
-def contains_duplicate(nums: list[int]) -> bool:
-    pass  # TODO: implement your solution here
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, speeds up the Bloom tier and external sort
+    np = None
+
+# Default peak memory the tiers may use on top of the input itself.
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+# Rough cost of one set entry (hash table slot with load factor headroom).
+SET_BYTES_PER_ITEM = 48
+# Bloom filter false positive rate when the budget allows the optimal size.
+BLOOM_FALSE_POSITIVE_RATE = 0.01
+INT64_BYTES = 8
+# Most sorted runs the external sort merges (and keeps open) at once.
+MAX_MERGE_FAN_IN = 128
+
+
+def contains_duplicate(
+    nums: list[int], memory_budget: int = DEFAULT_MEMORY_BUDGET
+) -> bool:
+    """
+    Returns True if any value appears at least twice in nums.
+
+    Tiers, picked by how much a set of all values would cost:
+    - fits in memory_budget: one set, stop at the first repeated value.
+    - larger: Bloom filter prefilter capped at memory_budget, then an exact
+      pass that only tracks the few values the filter flagged.
+    - filter flags more values than the budget holds: nums are spilled to
+      a temporary int64 file and checked by contains_duplicate_file. Values
+      outside int64 cannot be spilled; they get the set tier, over budget.
+    For data that does not fit in RAM use contains_duplicate_file.
+
+    Args:
+        nums (list[int]): values to check.
+        memory_budget (int): bytes the check may allocate.
+
+    Returns:
+        bool: True if there is a duplicate.
+    """
+    if len(nums) * SET_BYTES_PER_ITEM <= memory_budget:
+        return _contains_duplicate_set(nums)
+    return _contains_duplicate_bloom(nums, memory_budget)
+
+
+def _contains_duplicate_set(nums) -> bool:
+    seen = set()
+    for num in nums:
+        if num in seen:
+            return True
+        seen.add(num)
+    return False
+
+
+# Bloom filter hashing: multiplicative mix then double hashing, since
+# hash(int) alone is the identity.
+_BLOOM_MIX = 0x9E3779B97F4A7C15
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+# numpy temporaries per element while hashing a chunk (slice, int64 copy,
+# hash words, positions, masks, sorted copy).
+BLOOM_NUMPY_BYTES_PER_ITEM = 80
+# Below this many values per chunk numpy call overhead dominates.
+BLOOM_NUMPY_MIN_CHUNK = 256
+
+
+def _contains_duplicate_bloom(nums, memory_budget: int) -> bool:
+    """
+    Bloom filter prefilter with exact confirmation.
+
+    First pass: a value whose bits are all already set *may* be a repeat
+    and is recorded as a candidate. Second pass: count only the candidate
+    values exactly. A false positive costs one extra candidate, never a
+    wrong answer.
+
+    memory_budget is split: half for the bits, a quarter for the hashing
+    temporaries and a quarter for the candidate and confirmation sets. If
+    the filter flags more candidates than fit, the filter is too small
+    for this input and the external sort takes over.
+    """
+    n = len(nums)
+    optimal_bits = math.ceil(
+        -n * math.log(BLOOM_FALSE_POSITIVE_RATE) / math.log(2) ** 2
+    )
+    num_bits = max(8, min(optimal_bits, memory_budget // 2 * 8))
+    num_hashes = max(1, round(num_bits / n * math.log(2)))
+    max_candidates = memory_budget // 4 // (2 * SET_BYTES_PER_ITEM)
+
+    chunk_items = memory_budget // 4 // BLOOM_NUMPY_BYTES_PER_ITEM
+    use_numpy = np is not None and chunk_items >= BLOOM_NUMPY_MIN_CHUNK
+    if use_numpy:
+        try:
+            candidates = _bloom_candidates_numpy(
+                nums, num_bits, num_hashes, chunk_items, max_candidates
+            )
+        except OverflowError:  # values beyond int64
+            use_numpy = False
+    if not use_numpy:
+        candidates = _bloom_candidates_python(
+            nums, num_bits, num_hashes, max_candidates
+        )
+    if candidates is None:
+        return _contains_duplicate_external(nums, memory_budget)
+
+    if not candidates:
+        return False
+    seen = set()
+    for num in nums:
+        if num in candidates:
+            if num in seen:
+                return True
+            seen.add(num)
+    return False
+
+
+def _bloom_candidates_python(
+    nums, num_bits: int, num_hashes: int, max_candidates: int
+) -> set | None:
+    """First Bloom pass, one value at a time. None once max_candidates is exceeded."""
+    bits = bytearray((num_bits + 7) // 8)
+    candidates = set()
+    for num in nums:
+        h = (hash(num) * _BLOOM_MIX) & _MASK64
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        all_set = True
+        for i in range(num_hashes):
+            pos = (h1 + i * h2) % num_bits
+            byte = pos >> 3
+            mask = 1 << (pos & 7)
+            if not bits[byte] & mask:
+                all_set = False
+                bits[byte] |= mask
+        if all_set:
+            candidates.add(num)
+            if len(candidates) > max_candidates:
+                return None
+    return candidates
+
+
+def _bloom_candidates_numpy(
+    nums, num_bits: int, num_hashes: int, chunk_items: int, max_candidates: int
+) -> set | None:
+    """
+    First Bloom pass, vectorized over chunks of chunk_items values.
+
+    A whole chunk is tested against the bits before any of it is inserted
+    (so a value never finds its own bits), and repeats inside the chunk
+    are flagged by sorting it. None once max_candidates is exceeded.
+    """
+    bits = np.zeros((num_bits + 7) // 8, dtype=np.uint8)
+    mix = np.uint64(_BLOOM_MIX)
+    modulus = np.uint64(num_bits)
+    candidates = set()
+    for start in range(0, len(nums), chunk_items):
+        values = np.asarray(nums[start:start + chunk_items], dtype=np.int64)
+        h = values.view(np.uint64) * mix  # wraps modulo 2**64
+        h1 = h & np.uint64(0xFFFFFFFF)
+        h2 = (h >> np.uint64(32)) | np.uint64(1)
+        del h
+        all_set = np.ones(values.size, dtype=bool)
+        for i in range(num_hashes):
+            byte, mask = _bloom_bytes_and_masks(h1, h2, i, modulus)
+            all_set &= (bits[byte] & mask) != 0
+        candidates.update(values[all_set].tolist())
+        ordered = np.sort(values)
+        candidates.update(ordered[1:][ordered[1:] == ordered[:-1]].tolist())
+        del ordered, all_set
+        if len(candidates) > max_candidates:
+            return None
+        for i in range(num_hashes):
+            byte, mask = _bloom_bytes_and_masks(h1, h2, i, modulus)
+            np.bitwise_or.at(bits, byte, mask)
+    return candidates
+
+
+def _bloom_bytes_and_masks(h1, h2, i: int, modulus):
+    """Byte indexes and bit masks of the i-th hash for a chunk."""
+    pos = (h1 + np.uint64(i) * h2) % modulus
+    byte = (pos >> np.uint64(3)).astype(np.intp)
+    mask = np.left_shift(1, pos & np.uint64(7)).astype(np.uint8)
+    return byte, mask
+
+
+def _contains_duplicate_external(nums, memory_budget: int) -> bool:
+    """
+    Spills nums to a temporary int64 file for contains_duplicate_file.
+    Falls back to the set tier for values that do not fit in int64.
+    """
+    block_items = max(1, memory_budget // 4 // INT64_BYTES)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "ids.bin")
+        try:
+            with open(path, "wb") as f:
+                for start in range(0, len(nums), block_items):
+                    array("q", nums[start:start + block_items]).tofile(f)
+        except OverflowError:
+            return _contains_duplicate_set(nums)
+        return contains_duplicate_file(path, memory_budget)
+
+
+def contains_duplicate_file(
+    path: str, memory_budget: int = DEFAULT_MEMORY_BUDGET
+) -> bool:
+    """
+    External memory contains_duplicate over a binary file of int64 ids.
+
+    The file (native byte order) is memory mapped and sorted in chunks
+    that fit memory_budget; each sorted run is written to a temporary file.
+    The runs are then k-way merged with small read buffers, at most
+    MAX_MERGE_FAN_IN at a time. The scan stops at the first pair of equal
+    adjacent values, inside a chunk or in a merge.
+    Time complexity: O(n log n), Space complexity: O(memory_budget)
+
+    Args:
+        path (str): file with packed int64 values.
+        memory_budget (int): bytes the sort and merge buffers may use.
+
+    Returns:
+        bool: True if some id appears at least twice.
+    """
+    size = os.path.getsize(path)
+    if size % INT64_BYTES:
+        raise ValueError(f"{path} size is not a multiple of {INT64_BYTES} bytes")
+    if size == 0:
+        return False
+    # Per item: the int64 copy plus the bool adjacency mask with numpy;
+    # without it, sorted() makes a list of Python ints (~40 bytes each)
+    # on top of the array copies.
+    item_bytes = INT64_BYTES + 1 if np is not None else 56
+    chunk_items = max(1, memory_budget // item_bytes)
+
+    with tempfile.TemporaryDirectory() as run_dir:
+        run_paths = []
+        with (
+            open(path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
+            for offset in range(0, size, chunk_items * INT64_BYTES):
+                count = min(chunk_items, (size - offset) // INT64_BYTES)
+                if _sorted_run_has_duplicate(mm, offset, count, run_dir, run_paths):
+                    return True
+        # Merge at most MAX_MERGE_FAN_IN runs at once so open files and read
+        # buffers stay bounded; tiny budgets take several passes.
+        depth = 0
+        while len(run_paths) > MAX_MERGE_FAN_IN:
+            merged = []
+            for i in range(0, len(run_paths), MAX_MERGE_FAN_IN):
+                group = run_paths[i:i + MAX_MERGE_FAN_IN]
+                out_path = os.path.join(run_dir, f"merge{depth}_{len(merged)}.bin")
+                if _merged_runs_have_duplicate(group, memory_budget, out_path):
+                    return True
+                for run_path in group:
+                    os.remove(run_path)
+                merged.append(out_path)
+            run_paths = merged
+            depth += 1
+        return len(run_paths) > 1 and _merged_runs_have_duplicate(
+            run_paths, memory_budget
+        )
+
+
+def _sorted_run_has_duplicate(
+    mm: mmap.mmap, offset: int, count: int, run_dir: str, run_paths: list[str]
+) -> bool:
+    """
+    Sorts count values copied once from the mapping, checks them for
+    adjacent repeats and spills them to disk.
+    """
+    run_path = os.path.join(run_dir, f"run{len(run_paths)}.bin")
+    if np is not None:
+        values = np.frombuffer(mm, dtype=np.int64, count=count, offset=offset).copy()
+        values.sort()
+        if values.size > 1 and np.any(values[1:] == values[:-1]):
+            return True
+        values.tofile(run_path)
+    else:
+        values = array("q")
+        with memoryview(mm) as view:
+            values.frombytes(view[offset:offset + count * INT64_BYTES])
+        ordered = sorted(values)
+        if any(a == b for a, b in zip(ordered, ordered[1:])):
+            return True
+        values = array("q", ordered)
+        with open(run_path, "wb") as f:
+            values.tofile(f)
+    run_paths.append(run_path)
+    return False
+
+
+def _merged_runs_have_duplicate(
+    run_paths: list[str], memory_budget: int, out_path: str | None = None
+) -> bool:
+    """K-way merges sorted runs, into out_path if given. True at the first repeat."""
+    block_items = max(1, memory_budget // (INT64_BYTES * (len(run_paths) + 2)))
+    out = open(out_path, "wb", buffering=0) if out_path is not None else None
+    buffer = array("q")
+    previous = None
+    try:
+        for num in heapq.merge(*(_read_run(p, block_items) for p in run_paths)):
+            if num == previous:
+                return True
+            previous = num
+            if out is not None:
+                buffer.append(num)
+                if len(buffer) >= block_items:
+                    buffer.tofile(out)
+                    del buffer[:]
+        if out is not None:
+            buffer.tofile(out)
+    finally:
+        if out is not None:
+            out.close()
+    return False
+
+
+def _read_run(run_path: str, block_items: int):
+    """Yields the values of a sorted run, block_items at a time."""
+    with open(run_path, "rb", buffering=0) as f:
+        while block := f.read(block_items * INT64_BYTES):
+            values = array("q")
+            values.frombytes(block)
+            yield from values
+
+
+def contains_nearby_duplicate(events: Iterable[int], k: int) -> bool:
+    """
+    Returns True if the same value appears twice within k positions
+    (LeetCode #219), reading events once from any iterator.
+
+    Only the last k values are kept: a set for membership and a deque to
+    know which value leaves the window.
+    Time complexity: O(n), Space complexity: O(k)
+
+    Args:
+        events (Iterable[int]): values in arrival order, may be unbounded.
+        k (int): maximum index distance between the two equal values.
+
+    Returns:
+        bool: True at the first duplicate found, False if the input ends.
+    """
+    if k <= 0:
+        return False
+    window = deque()
+    in_window = set()
+    for value in events:
+        if value in in_window:
+            return True
+        in_window.add(value)
+        window.append(value)
+        if len(window) > k:
+            in_window.remove(window.popleft())
+    return False
+
+
+def contains_nearby_almost_duplicate(events: Iterable[int], k: int, t: int) -> bool:
+    """
+    Returns True if two values within k positions differ by at most t
+    (LeetCode #220), reading events once from any iterator.
+
+    Values go in buckets of width t + 1, so two values in the same bucket
+    are always close and only the two neighbouring buckets need a check.
+    A bucket never holds two window values, otherwise we already returned.
+    Time complexity: O(n), Space complexity: O(k)
+
+    Args:
+        events (Iterable[int]): values in arrival order, may be unbounded.
+        k (int): maximum index distance between the two values.
+        t (int): maximum value difference.
+
+    Returns:
+        bool: True at the first close pair found, False if the input ends.
+    """
+    if k <= 0 or t < 0:
+        return False
+    width = t + 1
+    window = deque()
+    buckets = {}
+    for value in events:
+        bucket = value // width
+        if bucket in buckets:
+            return True
+        below = buckets.get(bucket - 1)
+        if below is not None and value - below <= t:
+            return True
+        above = buckets.get(bucket + 1)
+        if above is not None and above - value <= t:
+            return True
+        buckets[bucket] = value
+        window.append(bucket)
+        if len(window) > k:
+            del buckets[window.popleft()]
+    return False
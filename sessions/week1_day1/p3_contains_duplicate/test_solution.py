@@ -1,4 +1,14 @@
-from solution import contains_duplicate
+from array import array
+
+from itertools import count
+
+import solution
+from solution import (
+    contains_duplicate,
+    contains_duplicate_file,
+    contains_nearby_almost_duplicate,
+    contains_nearby_duplicate,
+)
 
 
 def test_has_duplicate():
@@ -23,3 +33,82 @@ def test_empty():
 
 def test_negative_numbers():
     assert contains_duplicate([-1, -2, -3, -1]) is True
+
+
+def test_bloom_tier():
+    # Too small for a set, large enough for the filter and its candidates.
+    nums = list(range(0, 20000, 3))
+    assert contains_duplicate(nums, memory_budget=100_000) is False
+    assert contains_duplicate(nums + [300], memory_budget=100_000) is True
+
+
+def test_bloom_tier_without_numpy(monkeypatch):
+    monkeypatch.setattr(solution, "np", None)
+    nums = list(range(0, 20000, 3))
+    assert contains_duplicate(nums, memory_budget=100_000) is False
+    assert contains_duplicate(nums + [300], memory_budget=100_000) is True
+
+
+def test_bloom_candidates_overflow():
+    # A tiny budget saturates the filter, the external sort takes over.
+    nums = list(range(0, 20000, 3))
+    assert contains_duplicate(nums, memory_budget=64) is False
+    assert contains_duplicate(nums + [300], memory_budget=64) is True
+
+
+def test_bloom_overflow_beyond_int64():
+    # Too big to spill as int64: the exact set tier answers instead.
+    nums = [2**70, 2**70 + 1] + list(range(5000))
+    assert contains_duplicate(nums, memory_budget=64) is False
+    assert contains_duplicate(nums + [2**70], memory_budget=64) is True
+
+
+def _write_ids(path, values):
+    with open(path, "wb") as f:
+        array("q", values).tofile(f)
+    return str(path)
+
+
+def test_file_no_duplicate(tmp_path):
+    path = _write_ids(tmp_path / "ids.bin", range(5000, 0, -1))
+    assert contains_duplicate_file(path, memory_budget=800) is False
+
+
+def test_file_duplicate_across_chunks(tmp_path):
+    values = list(range(5000, 0, -1)) + [-7, 4321]
+    path = _write_ids(tmp_path / "ids.bin", values)
+    assert contains_duplicate_file(path, memory_budget=800) is True
+
+
+def test_file_multi_pass_merge(tmp_path):
+    # One value per run: more runs than MAX_MERGE_FAN_IN.
+    values = list(range(1000, 0, -1))
+    path = _write_ids(tmp_path / "ids.bin", values)
+    assert contains_duplicate_file(path, memory_budget=8) is False
+    path = _write_ids(tmp_path / "dup.bin", values + [500])
+    assert contains_duplicate_file(path, memory_budget=8) is True
+
+
+def test_file_empty(tmp_path):
+    path = _write_ids(tmp_path / "ids.bin", [])
+    assert contains_duplicate_file(path) is False
+
+
+def test_nearby_duplicate():
+    assert contains_nearby_duplicate([1, 2, 3, 1], 3) is True
+    assert contains_nearby_duplicate([1, 0, 1, 1], 1) is True
+    assert contains_nearby_duplicate([1, 2, 3, 1, 2, 3], 2) is False
+    assert contains_nearby_duplicate([1, 1], 0) is False
+
+
+def test_nearby_duplicate_unbounded_stream():
+    events = (i % 1000 for i in count())
+    assert contains_nearby_duplicate(events, 1000) is True
+
+
+def test_nearby_almost_duplicate():
+    assert contains_nearby_almost_duplicate([1, 2, 3, 1], 3, 0) is True
+    assert contains_nearby_almost_duplicate([1, 0, 1, 1], 1, 2) is True
+    assert contains_nearby_almost_duplicate([1, 5, 9, 1, 5, 9], 2, 3) is False
+    assert contains_nearby_almost_duplicate([-3, 3, -6], 2, 3) is True
+    assert contains_nearby_almost_duplicate(iter([10, 20, 15]), 1, 4) is False
@@ -0,0 +1,29 @@
+"""
+Benchmark for max_profit_general (k transactions, rolling DP).
+
+Run: python bench_solution.py
+"""
+
+import random
+import time
+
+from solution import max_profit_general
+
+
+def bench(n: int, k: int, fee: int = 0, cooldown: int = 0) -> float:
+    rng = random.Random(n)
+    prices = [rng.randint(1, 1000) for _ in range(n)]
+    start = time.perf_counter()
+    max_profit_general(prices, k=k, fee=fee, cooldown=cooldown)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print(f"{'n':>9} {'k':>5} {'fee':>4} {'cooldown':>8} {'seconds':>9}")
+    for n in (10**4, 10**5, 10**6):
+        for k in (1, 10, 100):
+            print(f"{n:>9} {k:>5} {0:>4} {0:>8} {bench(n, k):>9.3f}")
+    seconds = bench(10**6, 100, fee=2, cooldown=1)
+    print(f"{10**6:>9} {100:>5} {2:>4} {1:>8} {seconds:>9.3f}")
+    # k >= n / 2 takes the unlimited path.
+    print(f"{10**6:>9} {'n/2':>5} {0:>4} {0:>8} {bench(10**6, 10**6 // 2):>9.3f}")
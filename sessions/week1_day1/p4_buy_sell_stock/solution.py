@@ -11,6 +11,279 @@ Example:
     Output: 5   # Buy on day 1 (price=1), sell on day 4 (price=6)
 """
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, only max_profit_batch needs it
+    np = None
+
 
 def max_profit(prices: list[int]) -> int:
-    pass  # TODO: implement your solution here
+    """
+    Keep the cheapest price seen so far and sell against it every day.
+    Time complexity: O(n)
+    Space complexity: O(1)
+
+    Args:
+        prices (list[int]): price per day.
+
+    Returns:
+        int: best profit of one buy followed by one sell, 0 if none.
+    """
+    min_price = float("inf")
+    best = 0
+    for price in prices:
+        if price < min_price:
+            min_price = price
+        elif price - min_price > best:
+            best = price - min_price
+    return best
+
+
+class ProfitTracker:
+    """
+    Incremental max_profit for a live price feed, O(1) per tick.
+
+    Holds the same state as the max_profit loop (cheapest tick so far and
+    the best trade) so nothing is recomputed when a tick arrives.
+    __slots__ keeps one tracker per instrument small (no __dict__).
+    """
+
+    __slots__ = ("ticks", "min_price", "min_index", "best", "buy_index", "sell_index")
+
+    def __init__(self):
+        self.ticks = 0
+        self.min_price = None
+        self.min_index = None
+        self.best = 0
+        self.buy_index = None
+        self.sell_index = None
+
+    def update(self, price: int) -> tuple[int, int | None, int | None]:
+        """
+        Adds the next tick.
+
+        Args:
+            price (int): price of the new tick.
+
+        Returns:
+            tuple: (best profit, buy tick index, sell tick index), the
+            indices are None while no profitable trade exists.
+        """
+        index = self.ticks
+        self.ticks = index + 1
+        if self.min_price is None or price < self.min_price:
+            self.min_price = price
+            self.min_index = index
+        elif price - self.min_price > self.best:
+            self.best = price - self.min_price
+            self.buy_index = self.min_index
+            self.sell_index = index
+        return self.best, self.buy_index, self.sell_index
+
+
+def _max_profit_rows(prices):
+    """max_profit for every row of a 2D array, plus buy and sell days."""
+    days = prices.shape[1]
+    running_min = np.minimum.accumulate(prices, axis=1)
+    gains = prices - running_min
+    sell = np.argmax(gains, axis=1)
+    rows = np.arange(prices.shape[0])
+    profits = gains[rows, sell]
+    del gains
+    # Day on which the running minimum was last set, carried forward.
+    min_day = np.where(prices == running_min, np.arange(days), 0)
+    np.maximum.accumulate(min_day, axis=1, out=min_day)
+    buy = min_day[rows, sell]
+    no_trade = profits <= 0
+    buy[no_trade] = -1
+    sell[no_trade] = -1
+    return profits, buy, sell
+
+
+def _max_profit_block(
+    names: tuple[str, ...], shape: tuple[int, int], dtype: str, start: int, stop: int
+):
+    """Pool worker: solves rows [start, stop) in place in shared memory."""
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    try:
+        prices = np.ndarray(shape, dtype=dtype, buffer=blocks[0].buf)
+        profits = np.ndarray(shape[:1], dtype=dtype, buffer=blocks[1].buf)
+        buy = np.ndarray(shape[:1], dtype=np.int64, buffer=blocks[2].buf)
+        sell = np.ndarray(shape[:1], dtype=np.int64, buffer=blocks[3].buf)
+        profits[start:stop], buy[start:stop], sell[start:stop] = _max_profit_rows(
+            prices[start:stop]
+        )
+        del prices, profits, buy, sell
+    finally:
+        for block in blocks:
+            block.close()
+
+
+def max_profit_batch(prices, chunk_rows: int | None = None, workers: int | None = None):
+    """
+    max_profit for many instruments at once (tickers x days array).
+
+    Vectorized with minimum.accumulate along the days axis, no Python
+    loop per ticker. With chunk_rows the rows are processed in blocks to
+    bound the temporaries; with workers > 1 as well, the blocks run in a
+    process pool that reads the prices from shared memory and writes the
+    results back in place, so no row is pickled.
+
+    Args:
+        prices: 2D array-like, one row per ticker.
+        chunk_rows (int | None): rows per block. None for one pass, or
+            one block per worker when workers > 1.
+        workers (int | None): processes for the chunked mode, None or 1
+            to stay in process.
+
+    Returns:
+        tuple: (profits, buy_days, sell_days) arrays of length tickers,
+        days are -1 where no profitable trade exists.
+    """
+    if np is None:
+        raise ImportError("max_profit_batch requires numpy")
+    prices = np.asarray(prices)
+    if prices.ndim != 2:
+        raise ValueError("prices must be a 2D (tickers x days) array")
+    n_rows, days = prices.shape
+    if n_rows == 0 or days == 0:
+        empty = np.full(n_rows, -1, dtype=np.int64)
+        return np.zeros(n_rows, dtype=prices.dtype), empty, empty.copy()
+    if chunk_rows is None:
+        if not workers or workers <= 1:
+            return _max_profit_rows(prices)
+        chunk_rows = -(-n_rows // workers)  # one block per worker
+
+    starts = range(0, n_rows, chunk_rows)
+    if not workers or workers <= 1:
+        profits = np.empty(n_rows, dtype=prices.dtype)
+        buy = np.empty(n_rows, dtype=np.int64)
+        sell = np.empty(n_rows, dtype=np.int64)
+        for start in starts:
+            stop = start + chunk_rows
+            profits[start:stop], buy[start:stop], sell[start:stop] = _max_profit_rows(
+                prices[start:stop]
+            )
+        return profits, buy, sell
+
+    sizes = (prices.nbytes, n_rows * prices.itemsize, n_rows * 8, n_rows * 8)
+    blocks = [shared_memory.SharedMemory(create=True, size=size) for size in sizes]
+    try:
+        np.ndarray(prices.shape, dtype=prices.dtype, buffer=blocks[0].buf)[:] = prices
+        names = tuple(block.name for block in blocks)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    _max_profit_block,
+                    names,
+                    prices.shape,
+                    prices.dtype.str,
+                    start,
+                    start + chunk_rows,
+                )
+                for start in starts
+            ]
+            for future in futures:
+                future.result()
+        profits = np.ndarray(n_rows, dtype=prices.dtype, buffer=blocks[1].buf).copy()
+        buy = np.ndarray(n_rows, dtype=np.int64, buffer=blocks[2].buf).copy()
+        sell = np.ndarray(n_rows, dtype=np.int64, buffer=blocks[3].buf).copy()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return profits, buy, sell
+
+
+# Below this many transactions the per-day numpy call overhead costs more
+# than the plain Python loop over k.
+NUMPY_MIN_K = 32
+
+
+def max_profit_general(
+    prices: list[int], k: int | None = None, fee: int = 0, cooldown: int = 0
+) -> int:
+    """
+    Best profit with at most k transactions, a fee per trade and a
+    cooldown (days after a sell before the next buy).
+
+    State machine DP rolled over the days: for every transaction count j
+    keep the best cash while holding (hold[j]) and while flat (free[j]).
+    Only the current day plus `cooldown` old free rows are kept, so memory
+    is O(k * (cooldown + 1)) instead of O(n * k).
+    With k >= n / 2 the limit can never bind, so it switches to the
+    unlimited version: sum of the rises when there is no fee or cooldown,
+    else the same DP with a single count.
+    Time complexity: O(n * k), vectorized over k for large k when numpy
+    is installed.
+
+    Args:
+        prices (list[int]): price per day.
+        k (int | None): maximum number of buy/sell pairs, None for unlimited.
+        fee (int): paid on every sell.
+        cooldown (int): days that must pass after a sell before buying.
+
+    Returns:
+        int: best total profit, 0 if no trade helps.
+    """
+    n = len(prices)
+    if n < 2 or (k is not None and k <= 0):
+        return 0
+    if k is None or k >= n // 2:
+        if fee == 0 and cooldown == 0:
+            return sum(max(b - a, 0) for a, b in zip(prices, prices[1:]))
+        return _profit_dp_unlimited(prices, fee, cooldown)
+    if np is not None and k >= NUMPY_MIN_K:
+        return _profit_dp_numpy(prices, k, fee, cooldown)
+    return _profit_dp_python(prices, k, fee, cooldown)
+
+
+def _profit_dp_unlimited(prices, fee, cooldown):
+    hold = float("-inf")
+    free = 0
+    # free at the end of the last cooldown + 1 days, oldest first.
+    history = deque([0] * (cooldown + 1), maxlen=cooldown + 1)
+    for price in prices:
+        hold = max(hold, history[0] - price)
+        free = max(free, hold + price - fee)
+        history.append(free)
+    return free
+
+
+def _profit_dp_python(prices, k, fee, cooldown):
+    hold = [float("-inf")] * (k + 1)
+    free = [0] * (k + 1)
+    history = deque([free[:] for _ in range(cooldown + 1)], maxlen=cooldown + 1)
+    for price in prices:
+        buy_base = history[0]
+        for j in range(1, k + 1):
+            if buy_base[j - 1] - price > hold[j]:
+                hold[j] = buy_base[j - 1] - price
+            if hold[j] + price - fee > free[j]:
+                free[j] = hold[j] + price - fee
+        history.append(free[:])
+    return free[k]
+
+
+def _profit_dp_numpy(prices, k, fee, cooldown):
+    hold = np.full(k + 1, -np.inf)
+    free = np.zeros(k + 1)
+    if cooldown:
+        history = deque([free.copy() for _ in range(cooldown + 1)], maxlen=cooldown + 1)
+    else:
+        # free is only written after hold, so it still holds yesterday's row.
+        history = deque([free])
+    hold_j = hold[1:]
+    free_j = free[1:]
+    for price in prices:
+        # Buying on day i needs to be flat since day i - cooldown - 1.
+        np.maximum(hold_j, history[0][:-1] - price, out=hold_j)
+        np.maximum(free_j, hold_j + (price - fee), out=free_j)
+        if cooldown:
+            history.append(free.copy())
+    best = free[k]
+    return int(best) if float(best).is_integer() else float(best)
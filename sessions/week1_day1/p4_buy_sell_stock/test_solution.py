@@ -1,4 +1,6 @@
-from solution import max_profit
+import pytest
+
+from solution import ProfitTracker, max_profit, max_profit_batch, max_profit_general
 
 
 def test_basic():
@@ -27,3 +29,85 @@ def test_profit_at_end():
 
 def test_all_same():
     assert max_profit([3, 3, 3, 3]) == 0
+
+
+def test_tracker_updates():
+    tracker = ProfitTracker()
+    results = [tracker.update(p) for p in [7, 1, 5, 3, 6, 4]]
+    assert results == [
+        (0, None, None),
+        (0, None, None),
+        (4, 1, 2),
+        (4, 1, 2),
+        (5, 1, 4),
+        (5, 1, 4),
+    ]
+
+
+def test_tracker_matches_max_profit():
+    prices = [2, 4, 1, 7, 3, 9, 0, 8]
+    tracker = ProfitTracker()
+    for i, price in enumerate(prices):
+        assert tracker.update(price)[0] == max_profit(prices[: i + 1])
+
+
+def test_tracker_has_no_dict():
+    assert not hasattr(ProfitTracker(), "__dict__")
+
+
+BATCH_PRICES = [
+    [7, 1, 5, 3, 6, 4],
+    [7, 6, 4, 3, 1, 0],
+    [2, 4, 1, 7, 3, 3],
+    [3, 3, 3, 3, 3, 3],
+]
+
+
+def test_batch_matches_max_profit():
+    np = pytest.importorskip("numpy")
+    profits, buy, sell = max_profit_batch(np.array(BATCH_PRICES))
+    assert profits.tolist() == [max_profit(row) for row in BATCH_PRICES]
+    assert buy.tolist() == [1, -1, 2, -1]
+    assert sell.tolist() == [4, -1, 3, -1]
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_batch_chunked(workers):
+    np = pytest.importorskip("numpy")
+    prices = np.array(BATCH_PRICES * 5)
+    expected = max_profit_batch(prices)
+    result = max_profit_batch(prices, chunk_rows=3, workers=workers)
+    for got, want in zip(result, expected):
+        assert got.tolist() == want.tolist()
+
+
+def test_batch_workers_default_chunks():
+    np = pytest.importorskip("numpy")
+    prices = np.array(BATCH_PRICES * 5)
+    expected = max_profit_batch(prices)
+    result = max_profit_batch(prices, workers=3)
+    for got, want in zip(result, expected):
+        assert got.tolist() == want.tolist()
+
+
+def test_general_single_transaction():
+    for prices in BATCH_PRICES:
+        assert max_profit_general(prices, k=1) == max_profit(prices)
+
+
+def test_general_k_transactions():
+    assert max_profit_general([2, 4, 1], k=2) == 2
+    assert max_profit_general([3, 2, 6, 5, 0, 3], k=2) == 7
+    assert max_profit_general([3, 3, 5, 0, 0, 3, 1, 4], k=2) == 6
+    assert max_profit_general([1, 2, 3, 4, 5], k=0) == 0
+
+
+def test_general_unlimited():
+    assert max_profit_general([7, 1, 5, 3, 6, 4]) == 7
+    assert max_profit_general([7, 1, 5, 3, 6, 4], k=3) == 7
+
+
+def test_general_fee_and_cooldown():
+    assert max_profit_general([1, 3, 2, 8, 4, 9], fee=2) == 8
+    assert max_profit_general([1, 2, 3, 0, 2], cooldown=1) == 3
+    assert max_profit_general([1, 3, 2, 8, 4, 9], k=1, fee=2) == 6
@@ -0,0 +1,55 @@
+"""
+Benchmark: exact big-int product_except_self vs mod= and log-space modes.
+
+The exact answers grow to O(n) digits, so the exact version scales
+quadratically while the other two stay linear.
+Also times the parallel scan against the serial numpy one to find the
+crossover size (PARALLEL_MIN_SIZE) on this machine.
+Run: python bench_solution.py
+"""
+
+import os
+import random
+import time
+
+from solution import (
+    np,
+    product_except_self,
+    product_except_self_log,
+    product_except_self_numpy,
+    product_except_self_parallel,
+)
+
+MOD = 10**9 + 7
+
+
+def timed(func, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print(f"{'n':>8} {'exact':>9} {'mod':>9} {'log':>9}")
+    for n in (10**3, 3 * 10**3, 10**4, 3 * 10**4, 10**5, 10**6):
+        rng = random.Random(n)
+        nums = [rng.randint(2, 1000) for _ in range(n)]
+        # The exact version already takes minutes at n = 3 * 10**4.
+        exact = (
+            f"{timed(product_except_self, nums):9.3f}" if n <= 10**4 else f"{'-':>9}"
+        )
+        mod = timed(product_except_self, nums, mod=MOD)
+        log = timed(product_except_self_log, nums)
+        print(f"{n:>8} {exact} {mod:9.3f} {log:9.3f}")
+
+    if np is not None:
+        workers = os.cpu_count()
+        print(f"\n{'n':>10} {'numpy':>9} {f'{workers} procs':>9}")
+        for n in (10**5, 10**6, 5 * 10**6, 2 * 10**7, 10**8):
+            # Values close to 1 so float64 products neither overflow nor vanish.
+            values = np.random.default_rng(n).uniform(0.999999, 1.000001, n)
+            serial = timed(product_except_self_numpy, values)
+            parallel = timed(
+                product_except_self_parallel, values, workers=workers, min_size=0
+            )
+            print(f"{n:>10} {serial:9.3f} {parallel:9.3f}")
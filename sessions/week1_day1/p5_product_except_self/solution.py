@@ -13,5 +13,250 @@ Example:
 """
 
 
-def product_except_self(nums: list[int]) -> list[int]:
-    pass  # TODO: implement your solution here
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, only product_except_self_numpy needs it
+    np = None
+
+
+def product_except_self(nums: list[int], out=None, mod: int | None = None) -> list[int]:
+    """
+    Prefix pass then suffix pass, both written straight into the answer.
+    out[i] first gets the product of everything left of i, then the
+    suffix pass multiplies in everything right of i. No temporary arrays.
+    Time complexity: O(n) multiplications, but exact products of n values
+    grow to O(n) digits; pass mod to keep every number constant size.
+    Space complexity: O(1) besides the output
+
+    Args:
+        nums (list[int]): input values.
+        out: optional buffer of len(nums) (list, array or ndarray) to
+            write the answer into instead of allocating a new list.
+        mod (int | None): if given, every product is reduced modulo mod.
+
+    Returns:
+        list[int]: the answer, `out` itself when given.
+    """
+    n = len(nums)
+    if out is None:
+        out = [1] * n
+    elif len(out) != n:
+        raise ValueError(f"out has length {len(out)}, expected {n}")
+
+    if mod is not None:
+        return _product_except_self_mod(nums, out, mod)
+    prefix = 1
+    for i in range(n):
+        out[i] = prefix
+        prefix *= nums[i]
+    suffix = 1
+    for i in range(n - 1, -1, -1):
+        out[i] *= suffix
+        suffix *= nums[i]
+    return out
+
+
+def _product_except_self_mod(nums, out, mod):
+    n = len(nums)
+    prefix = 1 % mod
+    for i in range(n):
+        out[i] = prefix
+        prefix = prefix * nums[i] % mod
+    suffix = 1 % mod
+    for i in range(n - 1, -1, -1):
+        out[i] = out[i] * suffix % mod
+        suffix = suffix * nums[i] % mod
+    return out
+
+
+def product_except_self_log(nums: list[float]) -> tuple[list[float], list[int]]:
+    """
+    product_except_self in log space for numeric pipelines where the
+    products overflow floats.
+
+    Sums log|x| over the non zero values once and counts zeros and
+    negatives, then each answer is the total minus its own term.
+    Time complexity: O(n)
+    Space complexity: O(1) besides the output
+
+    Args:
+        nums (list[float]): input values.
+
+    Returns:
+        tuple[list[float], list[int]]: log|answer[i]| (-inf when the
+        answer is 0) and the sign of answer[i] (-1, 0 or 1).
+    """
+    zeros = 0
+    negatives = 0
+    for num in nums:
+        zeros += num == 0
+        negatives += num < 0
+    # A generator keeps fsum at O(1) extra space; the logs are recomputed
+    # for the answers below rather than stored.
+    total = math.fsum(math.log(abs(num)) for num in nums if num != 0)
+
+    log_abs = []
+    signs = []
+    for num in nums:
+        if num == 0:
+            if zeros == 1:
+                log_abs.append(total)
+                signs.append(-1 if negatives % 2 else 1)
+                continue
+        elif zeros == 0:
+            log_abs.append(total - math.log(abs(num)))
+            signs.append(-1 if (negatives - (num < 0)) % 2 else 1)
+            continue
+        log_abs.append(-math.inf)
+        signs.append(0)
+    return log_abs, signs
+
+
+def product_except_self_numpy(nums, out=None):
+    """
+    product_except_self with numpy cumprod, for 1D arrays or row-wise for
+    2D (one problem per row).
+
+    The exclusive prefix products are written into out by cumprod itself;
+    the suffix products need one temporary. Zeros need no special case
+    since nothing is divided.
+
+    Args:
+        nums: 1D or 2D array-like.
+        out: optional ndarray with the shape of nums.
+
+    Returns:
+        ndarray: the answer, `out` itself when given.
+    """
+    if np is None:
+        raise ImportError("product_except_self_numpy requires numpy")
+    values = np.asarray(nums)
+    if out is None:
+        out = np.empty_like(values)
+    elif out.shape != values.shape:
+        raise ValueError(f"out has shape {out.shape}, expected {values.shape}")
+    if values.shape[-1] == 0:
+        return out
+
+    out[..., 0] = 1
+    np.cumprod(values[..., :-1], axis=-1, out=out[..., 1:])
+    # suffix[..., j] is the product of values[..., n - 1 - j:], reversed below.
+    suffix = np.cumprod(values[..., :0:-1], axis=-1)
+    out[..., :-1] *= suffix[..., ::-1]
+    return out
+
+
+# Below this many elements the pool start up (~50 ms) and the copies in and
+# out of shared memory cost more than the single core numpy scan saves
+# (~20 ns per element). Check on the target machine with bench_solution.py.
+PARALLEL_MIN_SIZE = 5_000_000
+
+
+def _attach(name: str, shape: tuple[int, ...], dtype: str):
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _chunk_product(
+    name: str, shape: tuple[int, ...], dtype: str, start: int, stop: int
+):
+    """Pool worker, step 1: product of one chunk of the shared input."""
+    block, values = _attach(name, shape, dtype)
+    try:
+        return values[start:stop].prod()
+    finally:
+        del values
+        block.close()
+
+
+def _chunk_scan(
+    in_name: str,
+    out_name: str,
+    shape: tuple[int, ...],
+    dtype: str,
+    start: int,
+    stop: int,
+    offset,
+):
+    """Pool worker, step 3: local prefix/suffix scan times the chunk offset."""
+    in_block, values = _attach(in_name, shape, dtype)
+    out_block, out = _attach(out_name, shape, dtype)
+    try:
+        chunk_out = out[start:stop]
+        product_except_self_numpy(values[start:stop], out=chunk_out)
+        chunk_out *= offset
+        del chunk_out
+    finally:
+        del values, out
+        in_block.close()
+        out_block.close()
+
+
+def product_except_self_parallel(
+    nums, workers: int | None = None, min_size: int = PARALLEL_MIN_SIZE
+):
+    """
+    product_except_self on a 1D array across a process pool.
+
+    1. The input is placed in shared memory and split in one chunk per
+       worker; each worker returns the product of its chunk.
+    2. The parent combines those products into one offset per chunk: the
+       product of every other chunk.
+    3. Each worker runs the serial prefix/suffix scan on its chunk and
+       multiplies in its offset, writing straight into a shared output.
+    Only chunk bounds and scalars cross process boundaries.
+    Inputs shorter than min_size use product_except_self_numpy directly.
+
+    Args:
+        nums: 1D numeric array-like.
+        workers (int | None): pool size, defaults to os.cpu_count().
+        min_size (int): crossover size below which the serial path is used.
+
+    Returns:
+        ndarray: the answer.
+    """
+    if np is None:
+        raise ImportError("product_except_self_parallel requires numpy")
+    values = np.asarray(nums)
+    if values.ndim != 1:
+        raise ValueError("product_except_self_parallel expects a 1D array")
+    workers = workers or os.cpu_count() or 1
+    n = values.size
+    if n < min_size or workers < 2 or n < 2 * workers:
+        return product_except_self_numpy(values)
+
+    bounds = [n * c // workers for c in range(workers + 1)]
+    chunks = list(zip(bounds, bounds[1:]))
+    in_block = shared_memory.SharedMemory(create=True, size=values.nbytes)
+    out_block = shared_memory.SharedMemory(create=True, size=values.nbytes)
+    try:
+        shared = np.ndarray(values.shape, dtype=values.dtype, buffer=in_block.buf)
+        shared[:] = values
+        del shared
+        args = (values.shape, values.dtype.str)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            jobs = ((in_block.name, *args, a, b) for a, b in chunks)
+            totals = list(pool.map(_chunk_product, *zip(*jobs)))
+            # offsets[c] = product of every chunk but c, again without division.
+            offsets = product_except_self_numpy(np.array(totals, dtype=values.dtype))
+            futures = [
+                pool.submit(
+                    _chunk_scan, in_block.name, out_block.name, *args, a, b, offsets[c]
+                )
+                for c, (a, b) in enumerate(chunks)
+            ]
+            for future in futures:
+                future.result()
+        result = np.ndarray(
+            values.shape, dtype=values.dtype, buffer=out_block.buf
+        ).copy()
+    finally:
+        for block in (in_block, out_block):
+            block.close()
+            block.unlink()
+    return result
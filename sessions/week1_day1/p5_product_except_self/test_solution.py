@@ -1,4 +1,14 @@
-from solution import product_except_self
+import math
+from array import array
+
+import pytest
+
+from solution import (
+    product_except_self,
+    product_except_self_log,
+    product_except_self_numpy,
+    product_except_self_parallel,
+)
 
 
 def test_basic():
@@ -23,3 +33,80 @@ def test_two_elements():
 
 def test_all_ones():
     assert product_except_self([1, 1, 1, 1]) == [1, 1, 1, 1]
+
+
+def test_empty():
+    assert product_except_self([]) == []
+
+
+def test_out_buffer():
+    out = array("q", [0] * 4)
+    result = product_except_self([1, 2, 3, 4], out=out)
+    assert result is out
+    assert list(out) == [24, 12, 8, 6]
+
+
+def test_out_wrong_length():
+    with pytest.raises(ValueError):
+        product_except_self([1, 2, 3], out=[0, 0])
+
+
+def test_numpy():
+    np = pytest.importorskip("numpy")
+    for nums in ([1, 2, 3, 4], [0, 1, 2, 3], [0, 0, 2, 3], [-1, 1, 0, -3, 3], [5]):
+        expected = product_except_self(nums)
+        assert product_except_self_numpy(np.array(nums)).tolist() == expected
+
+
+def test_numpy_out_and_batch():
+    np = pytest.importorskip("numpy")
+    rows = np.array([[1, 2, 3, 4], [0, 1, 2, 3], [-1, 1, 0, -3]])
+    out = np.zeros_like(rows)
+    assert product_except_self_numpy(rows, out=out) is out
+    assert out.tolist() == [product_except_self(row) for row in rows.tolist()]
+
+
+def test_mod():
+    nums = [-1, 1, 0, -3, 3, 10**12, 7]
+    mod = 10**9 + 7
+    expected = [x % mod for x in product_except_self(nums)]
+    assert product_except_self(nums, mod=mod) == expected
+
+
+def test_log_space():
+    nums = [-1.5, 2.0, 4.0, -3.0]
+    log_abs, signs = product_except_self_log(nums)
+    for got_log, sign, expected in zip(log_abs, signs, product_except_self(nums)):
+        assert sign * math.exp(got_log) == pytest.approx(expected)
+
+
+def test_log_space_zeros():
+    log_abs, signs = product_except_self_log([0, -2, 3])
+    assert signs == [-1, 0, 0]
+    assert log_abs[0] == pytest.approx(math.log(6))
+    assert log_abs[1:] == [-math.inf, -math.inf]
+    assert product_except_self_log([0, 0, 2])[1] == [0, 0, 0]
+
+
+def test_log_space_huge():
+    log_abs, signs = product_except_self_log([1e300] * 4)
+    assert log_abs[0] == pytest.approx(3 * math.log(1e300))
+    assert signs == [1, 1, 1, 1]
+
+
+def test_parallel_matches_serial():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(0)
+    values = rng.choice([-2.0, -1.0, 0.5, 1.0, 2.0], size=1000)
+    expected = product_except_self_numpy(values)
+    result = product_except_self_parallel(values, workers=3, min_size=0)
+    assert np.allclose(result, expected)
+
+
+def test_parallel_with_zero():
+    np = pytest.importorskip("numpy")
+    values = np.array([0, 1, 2, 3, 4, 5, 6, 7])
+    expected = [5040, 0, 0, 0, 0, 0, 0, 0]
+    result = product_except_self_parallel(values, workers=2, min_size=0)
+    assert result.tolist() == expected
+    assert product_except_self_parallel(values).tolist() == expected
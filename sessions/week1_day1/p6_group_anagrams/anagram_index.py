@@ -0,0 +1,216 @@
+"""
+Persistent anagram index on top of group_anagrams.
+
+Maps signature -> dictionary words, stored in one compact binary file that
+is opened with mmap. Lookups binary search the sorted signature table in
+place: nothing is deserialized, so opening the index is instant.
+
+File layout (little endian):
+    magic        8 bytes  b"ANAGIDX1"
+    count        u64      number of signatures n
+    sig_offsets  (n + 1) u64, byte ranges of the signatures in sig_blob
+    word_offsets (n + 1) u64, byte ranges of the word lists in word_blob
+    sig_blob     UTF-8 signatures, sorted by their bytes
+    word_blob    UTF-8 words, "\\n" separated, one sorted list per signature
+
+Tools:
+    python anagram_index.py build index.bin words.txt [more.txt ...]
+    python anagram_index.py add index.bin new_words.txt [...]
+    python anagram_index.py lookup index.bin word [word ...]
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Iterable, Iterator
+
+from solution import group_anagrams, sorted_signature
+
+MAGIC = b"ANAGIDX1"
+HEADER = struct.Struct("<8sQ")
+
+
+def build_index(words: Iterable[str], path: str) -> int:
+    """
+    Writes the index for `words` to `path` (atomically, through a temp file).
+
+    Args:
+        words (Iterable[str]): dictionary words, duplicates are dropped.
+        path (str): index file to create or replace.
+
+    Returns:
+        int: number of signatures written.
+    """
+    groups = group_anagrams(list(set(words)), sorted_signature)
+    entries = sorted(
+        (sorted_signature(group[0]).encode("utf-8"), sorted(group)) for group in groups
+    )
+    return _write_entries(entries, path)
+
+
+def _write_entries(entries: list[tuple[bytes, list[str]]], path: str) -> int:
+    n = len(entries)
+    sig_offsets = [0]
+    word_offsets = [0]
+    word_lists = []
+    for signature, group in entries:
+        word_list = "\n".join(group).encode("utf-8")
+        word_lists.append(word_list)
+        sig_offsets.append(sig_offsets[-1] + len(signature))
+        word_offsets.append(word_offsets[-1] + len(word_list))
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, n))
+        f.write(struct.pack(f"<{n + 1}Q", *sig_offsets))
+        f.write(struct.pack(f"<{n + 1}Q", *word_offsets))
+        f.writelines(signature for signature, _ in entries)
+        f.writelines(word_lists)
+    os.replace(tmp_path, path)
+    return n
+
+
+def add_words(path: str, words: Iterable[str]) -> int:
+    """
+    Adds words to an existing index and rewrites it.
+
+    Existing entries are read straight from the mapped file and merged with
+    the new groups; the rest of the dictionary is not grouped again.
+
+    Args:
+        path (str): index file to update.
+        words (Iterable[str]): words to add.
+
+    Returns:
+        int: number of signatures in the new index.
+    """
+    merged = {}
+    with AnagramIndex(path) as index:
+        for signature, group in index.items():
+            merged[signature.encode("utf-8")] = set(group)
+    for word in words:
+        merged.setdefault(sorted_signature(word).encode("utf-8"), set()).add(word)
+    entries = sorted((signature, sorted(group)) for signature, group in merged.items())
+    return _write_entries(entries, path)
+
+
+class AnagramIndex:
+    """
+    Read only view of an index file through mmap.
+
+    Lookups are a binary search over the signature table: O(log n) small
+    slices of the mapping, no parsing at open time (big endian hosts
+    unpack the two offset tables once, like bitgrid.BitGrid rows).
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not an anagram index")
+        table_bytes = (self._count + 1) * 8
+        self._view = memoryview(self._mm)
+        self._sig_offsets = self._offsets(HEADER.size, table_bytes)
+        self._word_offsets = self._offsets(HEADER.size + table_bytes, table_bytes)
+        self._sig_base = HEADER.size + 2 * table_bytes
+        self._word_base = self._sig_base + self._sig_offsets[self._count]
+
+    def _offsets(self, start: int, size: int):
+        """The u64 offset table at start, zero copy on little endian hosts."""
+        table = self._view[start:start + size]
+        if sys.byteorder == "little":
+            return table.cast("Q")
+        return struct.unpack(f"<{size // 8}Q", table)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _signature(self, i: int) -> bytes:
+        start = self._sig_base + self._sig_offsets[i]
+        return self._mm[start:self._sig_base + self._sig_offsets[i + 1]]
+
+    def _words(self, i: int) -> list[str]:
+        start = self._word_base + self._word_offsets[i]
+        stop = self._word_base + self._word_offsets[i + 1]
+        return self._mm[start:stop].decode("utf-8").split("\n")
+
+    def lookup(self, word: str) -> list[str]:
+        """
+        Returns the dictionary words that are anagrams of `word`.
+
+        Args:
+            word (str): query, does not need to be in the dictionary.
+
+        Returns:
+            list[str]: sorted matching words, [] if none.
+        """
+        target = sorted_signature(word).encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._signature(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._signature(lo) == target:
+            return self._words(lo)
+        return []
+
+    def items(self) -> Iterator[tuple[str, list[str]]]:
+        """Yields (signature, words) in signature order."""
+        for i in range(self._count):
+            yield self._signature(i).decode("utf-8"), self._words(i)
+
+    def close(self) -> None:
+        for table in (self._sig_offsets, self._word_offsets):
+            if isinstance(table, memoryview):
+                table.release()
+        self._view.release()
+        self._mm.close()
+
+    def __enter__(self) -> "AnagramIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _read_words(paths: list[str]) -> Iterator[str]:
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                word = line.strip()
+                if word:
+                    yield word
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="build an index from word files")
+    build.add_argument("index")
+    build.add_argument("files", nargs="+")
+    add = commands.add_parser("add", help="add the words of files to an index")
+    add.add_argument("index")
+    add.add_argument("files", nargs="+")
+    lookup = commands.add_parser("lookup", help="print the anagrams of words")
+    lookup.add_argument("index")
+    lookup.add_argument("words", nargs="+")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        print(f"{build_index(_read_words(args.files), args.index)} signatures")
+    elif args.command == "add":
+        print(f"{add_words(args.index, _read_words(args.files))} signatures")
+    else:
+        with AnagramIndex(args.index) as index:
+            for word in args.words:
+                print(f"{word}: {' '.join(index.lookup(word))}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,66 @@
+"""
+Benchmark group_anagrams signatures on a synthetic corpus.
+
+Reports throughput (words per second, best of three runs) and the peak
+memory of the grouping (tracemalloc, measured in a separate run since
+tracing slows it down).
+Run: python bench_solution.py [corpus_size]   (default 5_000_000)
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from string import ascii_lowercase
+
+from solution import (
+    count_signature,
+    group_anagrams,
+    packed_signature_factory,
+    pick_signature,
+    sorted_signature,
+)
+
+
+def make_corpus(size: int, min_len: int, max_len: int) -> list[str]:
+    rng = random.Random(size)
+    # A small vocabulary of stems shuffled into many anagrams.
+    stems = [
+        "".join(rng.choices(ascii_lowercase, k=rng.randint(min_len, max_len)))
+        for _ in range(size // 10 or 1)
+    ]
+    return ["".join(rng.sample(stem, len(stem))) for stem in rng.choices(stems, k=size)]
+
+
+def bench(words: list[str], signature, repeat: int = 3) -> tuple[float, float]:
+    # Best of `repeat` runs, single runs swing with GC and other load.
+    seconds = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        group_anagrams(words, signature)
+        seconds = min(seconds, time.perf_counter() - start)
+    tracemalloc.start()
+    group_anagrams(words, signature)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return len(words) / seconds, peak / 2**20
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    # Long words get a tenth of the corpus to stay within RAM.
+    for count, min_len, max_len in ((size, 3, 10), (size // 10, 80, 120)):
+        words = make_corpus(count, min_len, max_len)
+        signatures = {
+            "tuple(sorted(w))": lambda w: tuple(sorted(w)),
+            "sorted": sorted_signature,
+            "counts": count_signature,
+            "packed": packed_signature_factory(max_len),
+            "auto": None,
+        }
+        picked = pick_signature(words).__name__
+        print(f"\n{count} words, length {min_len}-{max_len}, auto picks {picked}")
+        print(f"{'signature':>17} {'words/s':>12} {'peak MiB':>9}")
+        for name, signature in signatures.items():
+            rate, peak = bench(words, signature)
+            print(f"{name:>17} {rate:>12,.0f} {peak:>9.1f}")
@@ -11,5 +11,224 @@ Example:
 """
 
 
-def group_anagrams(strs: list[str]) -> list[list[str]]:
-    pass  # TODO: implement your solution here
+import os
+import zlib
+from collections import defaultdict
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from string import ascii_lowercase
+
+# Longest word for the packed signature. Past it, 26 str.count scans in C
+# beat one dict lookup per character: on fixed length words packed leads
+# up to 80 chars (163k vs 139k words/s) and trails from 88 (138k vs 149k).
+PACKED_MAX_LEN = 80
+# Words joined per step when pick_signature checks the alphabet.
+PICK_CHUNK = 4096
+_LOWERCASE_BYTES = ascii_lowercase.encode("ascii")
+
+
+def sorted_signature(word: str) -> str:
+    """Key for any Unicode word: its characters sorted. O(k log k)."""
+    return "".join(sorted(word))
+
+
+def count_signature(word: str) -> tuple[int, ...]:
+    """26-slot letter count tuple for a-z words, 26 C-level scans. O(26 k)."""
+    return tuple(map(word.count, ascii_lowercase))
+
+
+def packed_signature_factory(max_len: int) -> Callable[[str], int]:
+    """
+    Returns a key packing the 26 letter counts of an a-z word into one int.
+
+    Every letter gets a field wide enough to hold max_len, so different
+    counts can never carry into each other. O(k) with one dict lookup per
+    character and no per word list or tuple.
+    """
+    width = max(1, max_len.bit_length())
+    weights = {letter: 1 << (width * i) for i, letter in enumerate(ascii_lowercase)}
+
+    def packed_signature(word: str) -> int:
+        return sum(map(weights.__getitem__, word))
+
+    return packed_signature
+
+
+def pick_signature(strs: list[str]) -> Callable[[str], Hashable]:
+    """Picks the cheapest exact signature for this list of words."""
+    # C-level passes over the text, PICK_CHUNK words at a time to bound
+    # the joined copy: anything left once a-z is deleted rules out the
+    # count based signatures.
+    for start in range(0, len(strs), PICK_CHUNK):
+        text = "".join(strs[start:start + PICK_CHUNK])
+        if not text.isascii() or text.encode("ascii").translate(None, _LOWERCASE_BYTES):
+            return sorted_signature
+    max_len = max(map(len, strs), default=0)
+    if max_len <= PACKED_MAX_LEN:
+        return packed_signature_factory(max_len)
+    return count_signature
+
+
+def group_anagrams(
+    strs: list[str], signature: Callable[[str], Hashable] | None = None
+) -> list[list[str]]:
+    """
+    Groups words sharing the same signature (same letters, same counts).
+
+    By default the signature is picked from the workload: a packed int for
+    short a-z words, a 26-slot count tuple for long a-z words and the
+    sorted characters for anything else.
+    Time complexity: O(n k) for a-z words, O(n k log k) otherwise
+
+    Args:
+        strs (list[str]): words to group.
+        signature: optional key function, one of the *_signature helpers.
+
+    Returns:
+        list[list[str]]: the groups, words in input order.
+    """
+    key = signature or pick_signature(strs)
+    groups = defaultdict(list)
+    for word in strs:
+        groups[key(word)].append(word)
+    return list(groups.values())
+
+
+PARTITIONED_MARKER = "partitioned"
+# Shard routing key for a-z words. Fields are sized for PACKED_MAX_LEN, so
+# longer words may carry into the next letter; all anagrams still get the
+# same value, which is all routing needs.
+_shard_signature = packed_signature_factory(PACKED_MAX_LEN)
+
+
+def _shard_path(work_dir: str, shard: int, suffix: str) -> str:
+    return os.path.join(work_dir, f"shard-{shard:05d}.{suffix}")
+
+
+def _shard_of(word: str, num_shards: int) -> int:
+    """Shard of a word's anagram class, stable across processes and runs."""
+    if word.strip(ascii_lowercase):
+        key = sorted_signature(word).encode("utf-8")
+    else:
+        packed = _shard_signature(word)
+        key = packed.to_bytes((packed.bit_length() + 7) // 8, "little")
+    # crc32 is stable across processes and runs, hash() is not.
+    return zlib.crc32(key) % num_shards
+
+
+def _partition(paths: Iterable[str], work_dir: str, num_shards: int) -> None:
+    """Map step: append every word to the shard its signature hashes to."""
+    with ExitStack() as stack:
+        shards = [
+            stack.enter_context(
+                open(_shard_path(work_dir, i, "words"), "w", encoding="utf-8")
+            )
+            for i in range(num_shards)
+        ]
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    word = line.rstrip("\n")
+                    shards[_shard_of(word, num_shards)].write(word + "\n")
+    # Written last: its presence means every shard file is complete. It
+    # records num_shards since words were routed modulo that count.
+    with open(os.path.join(work_dir, PARTITIONED_MARKER), "w") as f:
+        f.write(f"{num_shards}\n")
+
+
+def _group_shard(work_dir: str, shard: int) -> int:
+    """Reduce step (pool worker): groups one shard into its .groups file."""
+    with open(_shard_path(work_dir, shard, "words"), encoding="utf-8") as f:
+        words = [line.rstrip("\n") for line in f]
+    groups = group_anagrams(words)
+    del words
+    tmp_path = _shard_path(work_dir, shard, "groups.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for group in groups:
+            f.write("\t".join(group) + "\n")
+    os.replace(tmp_path, _shard_path(work_dir, shard, "groups"))
+    return shard
+
+
+def group_anagrams_sharded(
+    paths: Iterable[str],
+    work_dir: str,
+    num_shards: int = 64,
+    workers: int | None = None,
+) -> Iterator[list[str]]:
+    """
+    group_anagrams for word lists larger than RAM, as a generator.
+
+    Map: words (one per line) are streamed from `paths` and appended to
+    one of num_shards files picked by a hash of a cheap signature (the
+    packed letter counts for a-z words), so all anagrams of a word land in
+    the same shard.
+    Reduce: a process pool groups each shard on its own, at most two
+    shards per worker ahead of the consumer; groups are yielded shard by
+    shard. Peak memory is bounded by workers times the largest shard,
+    since every worker holds one shard at a time.
+
+    Resumable: work_dir keeps the shards, the grouped result of every
+    finished shard (.groups) and a .done marker once all of a shard's
+    groups have been yielded. Running again with the same work_dir skips
+    the partition if it completed and never yields a done shard twice;
+    num_shards must match the one the partition was made with.
+
+    Words must not contain tabs, the separator of the .groups files.
+
+    Args:
+        paths (Iterable[str]): text files with one word per line.
+        work_dir (str): directory for shards and progress markers.
+        num_shards (int): number of shard files.
+        workers (int | None): pool size, defaults to os.cpu_count().
+
+    Yields:
+        list[str]: one anagram group.
+    """
+    os.makedirs(work_dir, exist_ok=True)
+    marker = os.path.join(work_dir, PARTITIONED_MARKER)
+    if not os.path.exists(marker):
+        _partition(paths, work_dir, num_shards)
+    with open(marker) as f:
+        partitioned_shards = f.read().strip()
+    if partitioned_shards != str(num_shards):
+        found = partitioned_shards or "an unknown number of"
+        raise ValueError(
+            f"{work_dir} was partitioned into {found} shards, not {num_shards}"
+        )
+
+    pending = [
+        i
+        for i in range(num_shards)
+        if not os.path.exists(_shard_path(work_dir, i, "done"))
+    ]
+    to_group = {
+        i for i in pending if not os.path.exists(_shard_path(work_dir, i, "groups"))
+    }
+    pool_size = workers or os.cpu_count() or 1
+    # Shards submitted ahead of the consumer: keeps the pool busy without
+    # grouping (and writing) the whole corpus before it is read.
+    ahead = 2 * pool_size
+    with ProcessPoolExecutor(max_workers=pool_size) as pool:
+        futures = {}
+        submitted = 0
+        try:
+            for n, shard in enumerate(pending):
+                for upcoming in pending[submitted:n + ahead]:
+                    if upcoming in to_group:
+                        futures[upcoming] = pool.submit(
+                            _group_shard, work_dir, upcoming
+                        )
+                submitted = max(submitted, n + ahead)
+                if shard in futures:
+                    futures.pop(shard).result()
+                groups_path = _shard_path(work_dir, shard, "groups")
+                with open(groups_path, encoding="utf-8") as f:
+                    for line in f:
+                        yield line.rstrip("\n").split("\t")
+                open(_shard_path(work_dir, shard, "done"), "w").close()
+        finally:
+            # Stopped early (close(), break, an error): drop the queued
+            # shards, only the running ones are waited for.
+            pool.shutdown(cancel_futures=True)
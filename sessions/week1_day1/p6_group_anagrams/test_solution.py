@@ -1,4 +1,15 @@
-from solution import group_anagrams
+from itertools import product
+
+import pytest
+
+from anagram_index import AnagramIndex, add_words, build_index, main
+from solution import (
+    count_signature,
+    group_anagrams,
+    group_anagrams_sharded,
+    packed_signature_factory,
+    sorted_signature,
+)
 
 
 def _normalize(groups: list[list[str]]) -> list[tuple[str, ...]]:
@@ -32,3 +43,128 @@ def test_all_anagrams():
     result = group_anagrams(["abc", "bca", "cab"])
     expected = [["abc", "bca", "cab"]]
     assert _normalize(result) == _normalize(expected)
+
+
+@pytest.mark.parametrize(
+    "signature", [sorted_signature, count_signature, packed_signature_factory(3)]
+)
+def test_signatures(signature):
+    result = group_anagrams(["eat", "tea", "tan", "ate", "nat", "bat"], signature)
+    expected = [["bat"], ["nat", "tan"], ["ate", "eat", "tea"]]
+    assert _normalize(result) == _normalize(expected)
+
+
+def test_packed_counts_do_not_carry():
+    words = ["a" * 16, "b", "a" * 15 + "b" * 2]
+    assert _normalize(group_anagrams(words)) == _normalize([[w] for w in words])
+
+
+def test_long_words():
+    words = ["ab" * 50, "ba" * 50, "a" * 100]
+    assert _normalize(group_anagrams(words)) == _normalize([words[:2], words[2:]])
+
+
+def test_unicode():
+    words = ["Été", "tÉé", "été"]
+    assert _normalize(group_anagrams(words)) == _normalize([words[:2], words[2:]])
+
+
+WORDS = ["eat", "tea", "tan", "ate", "nat", "bat", "", "tab", "a"]
+
+
+def _write_words(tmp_path, words):
+    paths = []
+    for i in range(0, len(words), 4):
+        path = tmp_path / f"words{i}.txt"
+        path.write_text("".join(w + "\n" for w in words[i:i + 4]), encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+def test_sharded_matches_in_memory(tmp_path):
+    paths = _write_words(tmp_path, WORDS)
+    result = list(
+        group_anagrams_sharded(paths, str(tmp_path / "work"), num_shards=3, workers=2)
+    )
+    assert _normalize(result) == _normalize(group_anagrams(WORDS))
+
+
+def test_sharded_resume(tmp_path):
+    paths = _write_words(tmp_path, WORDS)
+    work_dir = tmp_path / "work"
+    groups = group_anagrams_sharded(paths, str(work_dir), num_shards=4, workers=1)
+    first = next(groups)
+    groups.close()  # crash while yielding the first shard
+    rest = list(group_anagrams_sharded(paths, str(work_dir), num_shards=4, workers=1))
+    assert first in rest
+    assert _normalize(rest) == _normalize(group_anagrams(WORDS))
+
+    # Once every shard is done, only the shard without its marker is redone.
+    (work_dir / "shard-00000.done").unlink()
+    again = list(group_anagrams_sharded(paths, str(work_dir), num_shards=4, workers=1))
+    shard_0 = (work_dir / "shard-00000.groups").read_text(encoding="utf-8")
+    assert _normalize(again) == _normalize(
+        line.split("\t") for line in shard_0.splitlines()
+    )
+
+
+def test_sharded_early_close_stops_reducing(tmp_path):
+    words = ["".join(letters) for letters in product("abcdefgh", repeat=3)]
+    paths = _write_words(tmp_path, words)
+    work_dir = tmp_path / "work"
+    groups = group_anagrams_sharded(paths, str(work_dir), num_shards=50, workers=1)
+    next(groups)
+    groups.close()
+    # Only the window submitted ahead of the consumer was grouped.
+    assert len(list(work_dir.glob("*.groups"))) <= 3
+    rest = list(group_anagrams_sharded(paths, str(work_dir), num_shards=50, workers=1))
+    assert _normalize(rest) == _normalize(group_anagrams(words))
+
+
+def test_sharded_resume_rejects_other_num_shards(tmp_path):
+    paths = _write_words(tmp_path, WORDS)
+    work_dir = str(tmp_path / "work")
+    list(group_anagrams_sharded(paths, work_dir, num_shards=4, workers=1))
+    with pytest.raises(ValueError):
+        next(group_anagrams_sharded(paths, work_dir, num_shards=8, workers=1))
+
+
+def test_index_lookup(tmp_path):
+    path = str(tmp_path / "index.bin")
+    assert build_index(WORDS + ["eat", "café", "éfac"], path) == 6
+    with AnagramIndex(path) as index:
+        assert len(index) == 6
+        assert index.lookup("tae") == ["ate", "eat", "tea"]
+        assert index.lookup("abt") == ["bat", "tab"]
+        assert index.lookup("face") == []
+        assert index.lookup("faéc") == ["café", "éfac"]
+        assert index.lookup("zzz") == []
+
+
+def test_index_add_words(tmp_path):
+    path = str(tmp_path / "index.bin")
+    build_index(["eat", "tea", "bat"], path)
+    assert add_words(path, ["ate", "tab", "zoo"]) == 3
+    with AnagramIndex(path) as index:
+        assert index.lookup("eta") == ["ate", "eat", "tea"]
+        assert index.lookup("bat") == ["bat", "tab"]
+        assert index.lookup("ozo") == ["zoo"]
+
+
+def test_index_empty(tmp_path):
+    path = str(tmp_path / "index.bin")
+    build_index([], path)
+    with AnagramIndex(path) as index:
+        assert index.lookup("a") == []
+
+
+def test_index_tools(tmp_path, capsys):
+    words = tmp_path / "words.txt"
+    words.write_text("listen\nsilent\n", encoding="utf-8")
+    more = tmp_path / "more.txt"
+    more.write_text("enlist\n", encoding="utf-8")
+    path = str(tmp_path / "index.bin")
+    main(["build", path, str(words)])
+    main(["add", path, str(more)])
+    main(["lookup", path, "tinsel"])
+    assert capsys.readouterr().out.splitlines()[-1] == "tinsel: enlist listen silent"
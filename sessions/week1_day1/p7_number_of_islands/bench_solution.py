@@ -0,0 +1,56 @@
+"""
+Benchmark count_islands_tiled against the serial count_islands.
+
+Grids: a snake-shaped single island that crosses every tile (worst case
+for the boundary merge) and a random 50% land grid (worst case for runs).
+Run: python bench_solution.py [size]   (default 4000, grid is size x size)
+"""
+
+import os
+import random
+import sys
+import time
+
+from solution import count_islands, count_islands_tiled
+
+
+def snake_grid(size: int) -> bytes:
+    cells = bytearray(size * size)
+    for r in range(size):
+        if r % 2 == 0:
+            cells[r * size:(r + 1) * size] = b"\x01" * size
+        else:
+            cells[r * size + (size - 1 if r % 4 == 1 else 0)] = 1
+    return bytes(cells)
+
+
+def random_grid(size: int) -> bytes:
+    return random.Random(size).randbytes(size * size).translate(bytes([0, 1]) * 128)
+
+
+def timed(func, *args, **kwargs) -> tuple[int, float]:
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    cores = os.cpu_count() or 1
+    for name, cells in (("snake", snake_grid(size)), ("random", random_grid(size))):
+        expected, serial = timed(count_islands, cells, size)
+        print(f"\n{name} {size}x{size}: {expected} islands, serial {serial:.2f} s")
+        print(f"{'workers':>8} {'seconds':>8} {'speedup':>8}")
+        workers = 1
+        while workers <= cores:
+            count, seconds = timed(
+                count_islands_tiled,
+                cells,
+                size,
+                tile_rows=size // 8 or 1,
+                tile_cols=size // 4 or 1,
+                workers=workers,
+            )
+            assert count == expected
+            print(f"{workers:>8} {seconds:>8.2f} {serial / seconds:>8.2f}")
+            workers *= 2
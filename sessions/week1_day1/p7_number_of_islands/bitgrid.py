@@ -0,0 +1,157 @@
+"""
+Bit packed grid for the island problems: 1 bit per cell instead of an
+8 byte reference to a "0"/"1" string.
+
+Bit c of a row is bit (c % 8) of byte c // 8, so int.from_bytes(row,
+"little") has cell c at bit c. Rows are padded to a multiple of 8 bytes
+(padding bits are water) so they can be scanned as 64-bit words.
+
+File format (little endian): b"BITGRID1", rows u64, cols u64, then the
+padded rows one after the other. load() maps the file with mmap.
+"""
+
+import mmap
+import struct
+import sys
+
+from solution import count_components
+
+MAGIC = b"BITGRID1"
+HEADER = struct.Struct("<8sQQ")
+FULL_WORD = (1 << 64) - 1
+
+
+class BitGrid:
+    """Grid of land (1) / water (0) cells packed 8 per byte."""
+
+    def __init__(self, rows: int, cols: int, data=None):
+        self.rows = rows
+        self.cols = cols
+        # Bytes per row, whole 64-bit words.
+        self.stride = (cols + 63) // 64 * 8
+        self.data = bytearray(rows * self.stride) if data is None else data
+        self._mmap = None
+
+    @classmethod
+    def from_lists(cls, grid: list[list[str]]) -> "BitGrid":
+        """Packs the list of lists grid used by num_islands."""
+        rows = len(grid)
+        cols = len(grid[0]) if rows else 0
+        bits = cls(rows, cols)
+        for r, row in enumerate(grid):
+            bits.set_row(r, "".join(row))
+        return bits
+
+    @classmethod
+    def from_text(cls, path: str) -> "BitGrid":
+        """Packs a text file with one row of "0"/"1" characters per line."""
+        bits = cls(0, 0)
+        with open(path, encoding="ascii") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                if bits.rows == 0:
+                    bits = cls(0, len(line))
+                bits.rows += 1
+                bits.data.extend(bytes(bits.stride))
+                bits.set_row(bits.rows - 1, line)
+        return bits
+
+    @classmethod
+    def load(cls, path: str) -> "BitGrid":
+        """Opens a file written by save() through a read only mmap."""
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, rows, cols = HEADER.unpack_from(mm, 0)
+        if magic != MAGIC:
+            mm.close()
+            raise ValueError(f"{path} is not a bit grid file")
+        stride = (cols + 63) // 64 * 8
+        bits = cls(rows, cols, memoryview(mm)[HEADER.size:HEADER.size + rows * stride])
+        bits._mmap = mm
+        return bits
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, self.rows, self.cols))
+            f.write(self.data)
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self.data.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def set_row(self, r: int, text: str) -> None:
+        """Writes one row from a "0"/"1" string of length cols."""
+        if len(text) != self.cols:
+            raise ValueError(f"row {r} has {len(text)} cells, expected {self.cols}")
+        # Reversed so that cell c becomes bit c.
+        value = int(text[::-1], 2) if text else 0
+        start = r * self.stride
+        self.data[start:start + self.stride] = value.to_bytes(self.stride, "little")
+
+    def row(self, r: int) -> memoryview:
+        """Packed bytes of row r, stride bytes long."""
+        return memoryview(self.data)[r * self.stride:(r + 1) * self.stride]
+
+    def __getitem__(self, cell: tuple[int, int]) -> int:
+        r, c = cell
+        return self.data[r * self.stride + (c >> 3)] >> (c & 7) & 1
+
+    def to_lists(self) -> list[list[str]]:
+        lists = []
+        for r in range(self.rows):
+            bits = format(int.from_bytes(self.row(r), "little"), f"0{self.stride * 8}b")
+            lists.append(list(bits[::-1][:self.cols]))
+        return lists
+
+    def _words(self, r: int):
+        row = self.row(r)
+        if sys.byteorder == "little":
+            return row.cast("Q")
+        return struct.unpack(f"<{self.stride // 8}Q", row)
+
+    def row_runs(self):
+        """
+        Yields the [start, stop) land runs of every row, like
+        solution.row_runs, reading 64 cells per step: all water and all
+        land words are skipped with one comparison, the rest jump between
+        run ends with lowest set bit tricks.
+        """
+        for r in range(self.rows):
+            runs = []
+            run_start = None
+            for i, word in enumerate(self._words(r)):
+                base = i * 64
+                if word == 0:
+                    if run_start is not None:
+                        runs.append((run_start, base))
+                        run_start = None
+                    continue
+                if word == FULL_WORD:
+                    if run_start is None:
+                        run_start = base
+                    continue
+                bit = 0
+                while bit < 64:
+                    if run_start is None:
+                        rest = word >> bit  # next land cell
+                    else:
+                        rest = (~word & FULL_WORD) >> bit  # next water cell
+                    if rest == 0:
+                        break
+                    bit += (rest & -rest).bit_length() - 1
+                    if run_start is None:
+                        run_start = base + bit
+                    else:
+                        runs.append((run_start, base + bit))
+                        run_start = None
+            if run_start is not None:
+                runs.append((run_start, self.cols))
+            yield runs
+
+    def count_islands(self) -> int:
+        """num_islands directly on the packed grid."""
+        return count_components(self.row_runs())
@@ -16,6 +16,500 @@ Example:
     Output: 3
 """
 
+import os
+from array import array
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, ndarray grids are converted with it
+    np = None
+
+# bytes.translate tables: "0"/"1" text to 0/1 cells, and any non zero to 1.
+_TEXT_TO_CELLS = bytes.maketrans(b"01", b"\x00\x01")
+_NONZERO_TO_ONE = bytes([0]) + bytes([1]) * 255
+
 
 def num_islands(grid: list[list[str]]) -> int:
-    pass  # TODO: implement your solution here
+    """
+    Adapts the list of lists grid to count_islands with one conversion
+    pass (join and translate run in C).
+
+    Args:
+        grid (list[list[str]]): "1" land, "0" water.
+
+    Returns:
+        int: number of 4-connected islands.
+    """
+    if not grid or not grid[0]:
+        return 0
+    cells = "".join(map("".join, grid)).encode("latin-1").translate(_TEXT_TO_CELLS)
+    return count_islands(cells, len(grid[0]))
+
+
+def _find(parent: array, x: int) -> int:
+    # Iterative with path halving, never recursive.
+    while parent[x] != x:
+        parent[x] = parent[parent[x]]
+        x = parent[x]
+    return x
+
+
+def _cell_buffer(cells) -> memoryview:
+    """
+    Flat one byte per cell view of a grid buffer.
+
+    1 byte cells (bytes, bytearray, uint8/bool arrays) are viewed as is.
+    Wider numeric numpy dtypes are converted to 0/1 bytes first, and
+    string arrays (np.array(grid) of "0"/"1") are land where the cell is
+    "1". Other dtypes and buffers with multi byte items are rejected,
+    their raw bytes are not cells.
+    """
+    if np is not None and isinstance(cells, np.ndarray):
+        kind = cells.dtype.kind
+        if kind in "US":
+            land = "1" if kind == "U" else b"1"
+            cells = np.ascontiguousarray(cells == land).view(np.uint8)
+        elif kind not in "biuf":
+            raise ValueError(
+                f"cells must be numeric or '0'/'1' strings, got dtype {cells.dtype}"
+            )
+        elif cells.itemsize != 1 or not cells.flags.c_contiguous:
+            cells = np.ascontiguousarray(cells != 0).view(np.uint8)
+        return memoryview(cells).cast("B")
+    buf = memoryview(cells)
+    if buf.itemsize != 1:
+        raise ValueError(f"cells must be 1 byte each, got format {buf.format!r}")
+    return buf.cast("B")
+
+
+def row_runs(cells, width: int) -> Iterable[list[tuple[int, int]]]:
+    """
+    Yields, row by row, the [start, stop) column ranges of land.
+
+    Runs are found with bytes.find, so water is skipped in C and the
+    Python work is per run, not per cell.
+    """
+    buf = _cell_buffer(cells)
+    if len(buf) % width:
+        raise ValueError(f"{len(buf)} cells is not a multiple of width {width}")
+    for offset in range(0, len(buf), width):
+        yield _land_runs(buf[offset:offset + width])
+
+
+def _land_runs(row) -> list[tuple[int, int]]:
+    """[start, stop) ranges of non zero cells in one row buffer."""
+    row = bytes(row).translate(_NONZERO_TO_ONE)
+    runs = []
+    start = row.find(1)
+    while start != -1:
+        stop = row.find(0, start)
+        if stop == -1:
+            stop = len(row)
+        runs.append((start, stop))
+        start = row.find(1, stop)
+    return runs
+
+
+def _join_row(
+    parent: array,
+    previous: list[tuple[int, int, int]],
+    runs,
+    overlaps: array | None = None,
+) -> tuple[list[tuple[int, int, int]], list[tuple[int, int]]]:
+    """
+    Union-find step shared by the run based scans.
+
+    Gives every (start, stop) run of a row a new id in parent and joins it
+    with the (start, stop, id) runs of the previous row whose columns
+    overlap it, with a two pointer walk over both sorted rows.
+
+    Returns:
+        tuple: (current, unions). current is the row as (start, stop, id),
+        unions the joins made as (kept root, absorbed root) in order. If
+        overlaps is given, the cells each run shares with the previous row
+        are appended to it.
+    """
+    current = []
+    unions = []
+    j = 0
+    for start, stop in runs:
+        run_id = len(parent)
+        parent.append(run_id)
+        while j < len(previous) and previous[j][1] <= start:
+            j += 1
+        k = j
+        shared = 0
+        while k < len(previous) and previous[k][0] < stop:
+            above_start, above_stop, above_id = previous[k]
+            a = _find(parent, run_id)
+            b = _find(parent, above_id)
+            if a != b:
+                a, b = min(a, b), max(a, b)
+                parent[b] = a
+                unions.append((a, b))
+            shared += min(stop, above_stop) - max(start, above_start)
+            k += 1
+        if overlaps is not None:
+            overlaps.append(shared)
+        current.append((start, stop, run_id))
+    return current, unions
+
+
+def count_components(runs_by_row: Iterable[list[tuple[int, int]]]) -> int:
+    """
+    Counts 4-connected components from the land runs of each row.
+
+    Union-find over an array('i') of run ids: every run starts as a new
+    component and is merged with the runs of the previous row whose
+    columns overlap it. After each row the ids are renumbered to the
+    current row only, so memory is O(width) whatever the height.
+    """
+    count = 0
+    parent = array("i")
+    previous = []  # (start, stop, id) of the previous row
+    for runs in runs_by_row:
+        current, unions = _join_row(parent, previous, runs)
+        count += len(current) - len(unions)
+
+        # Components not reaching this row are final, keep only its runs
+        # and point each of them at the first run of its component.
+        first_of_root = {}
+        renumbered = array("i", range(len(current)))
+        for i, (_, _, run_id) in enumerate(current):
+            renumbered[i] = first_of_root.setdefault(_find(parent, run_id), i)
+        parent = renumbered
+        previous = [(start, stop, i) for i, (start, stop, _) in enumerate(current)]
+    return count
+
+
+@dataclass(slots=True)
+class IslandStats:
+    """Shape of one island, bounding box corners are inclusive."""
+
+    area: int
+    perimeter: int
+    min_row: int
+    min_col: int
+    max_row: int
+    max_col: int
+
+
+def label_islands(cells, width: int) -> tuple[int, array, list[IslandStats]]:
+    """
+    Counts, labels and measures the islands in one scan.
+
+    Same run based union-find as count_islands; while scanning, every run
+    adds its area, bounding box and perimeter (2 * length + 2, minus 2 per
+    cell of overlap with the row above) to its component, and stats are
+    merged when two components are joined. The label map is then filled
+    run by run (slice assignment in C), not cell by cell.
+    Space complexity: O(cells) for the label map, O(runs) otherwise
+
+    Args:
+        cells: flat buffer of height * width cells, non zero is land.
+        width (int): number of columns.
+
+    Returns:
+        tuple: (count, label map, stats). The label map is an array('I')
+        with one entry per cell, 0 for water and 1..count for islands;
+        stats[label - 1] describes island `label`.
+    """
+    if width <= 0:
+        return 0, array("I"), []
+    cells = _cell_buffer(cells)
+    parent = array("i")
+    stats = []
+    runs = array("i")  # (row, start, stop) per run id, flattened
+    previous = []
+    for r, row in enumerate(row_runs(cells, width)):
+        overlaps = array("i")
+        current, unions = _join_row(parent, previous, row, overlaps)
+        for (start, stop, _), shared in zip(current, overlaps):
+            runs.extend((r, start, stop))
+            perimeter = 2 * (stop - start) + 2 - 2 * shared
+            stats.append(IslandStats(stop - start, perimeter, r, start, r, stop - 1))
+        for a, b in unions:
+            _merge_stats(stats[a], stats[b])
+            stats[b] = None
+        previous = current
+
+    labels = array("I", [0]) * len(cells)
+    label_of_root = {}
+    islands = []
+    for run_id in range(len(parent)):
+        root = _find(parent, run_id)
+        label = label_of_root.get(root)
+        if label is None:
+            islands.append(stats[root])
+            label = label_of_root[root] = len(islands)
+        r, start, stop = runs[3 * run_id:3 * run_id + 3]
+        offset = r * width
+        labels[offset + start:offset + stop] = array("I", [label]) * (stop - start)
+    return len(islands), labels, islands
+
+
+def _merge_stats(into: IslandStats, other: IslandStats) -> None:
+    into.area += other.area
+    into.perimeter += other.perimeter
+    into.min_row = min(into.min_row, other.min_row)
+    into.min_col = min(into.min_col, other.min_col)
+    into.max_row = max(into.max_row, other.max_row)
+    into.max_col = max(into.max_col, other.max_col)
+
+
+class IslandCounter:
+    """
+    Island count under a stream of land additions (LeetCode #305).
+
+    Union-find with path halving and union by rank: add_land only unions
+    the new cell with its land neighbours, so each event is near constant
+    amortized time instead of a full num_islands pass.
+    With rows and cols the forest is two flat arrays (4 + 1 bytes per
+    cell); without them it is a dict keyed by (row, col), for sparse or
+    unbounded maps.
+    """
+
+    def __init__(self, rows: int | None = None, cols: int | None = None):
+        self.rows = rows
+        self.cols = cols
+        self.count = 0
+        if rows is not None and cols is not None:
+            self._parent = array("i", [-1]) * (rows * cols)
+            self._rank = bytearray(rows * cols)
+        else:
+            self._parent = {}
+            self._rank = {}
+
+    def _key(self, r: int, c: int):
+        if self.cols is None or self.rows is None:
+            return r, c
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            return None
+        return r * self.cols + c
+
+    def _is_land(self, key) -> bool:
+        if isinstance(self._parent, dict):
+            return key in self._parent
+        return key is not None and self._parent[key] >= 0
+
+    def _union(self, a, b) -> None:
+        parent, rank = self._parent, self._rank
+        a = _find(parent, a)
+        b = _find(parent, b)
+        if a == b:
+            return
+        if rank[a] < rank[b]:
+            a, b = b, a
+        parent[b] = a
+        if rank[a] == rank[b]:
+            rank[a] += 1
+        self.count -= 1
+
+    def add_land(self, r: int, c: int) -> int:
+        """
+        Turns (r, c) into land.
+
+        Args:
+            r (int): row.
+            c (int): column.
+
+        Returns:
+            int: number of islands after the event.
+        """
+        key = self._key(r, c)
+        if key is None:
+            raise IndexError(
+                f"cell ({r}, {c}) is outside the {self.rows}x{self.cols} grid"
+            )
+        if self._is_land(key):
+            return self.count
+        self._parent[key] = key
+        self._rank[key] = 0
+        self.count += 1
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            neighbour = self._key(nr, nc)
+            if self._is_land(neighbour):
+                self._union(key, neighbour)
+        return self.count
+
+    def add_many(self, cells: Iterable[tuple[int, int]]) -> list[int]:
+        """
+        Applies a batch of events.
+
+        Args:
+            cells (Iterable[tuple[int, int]]): (row, col) of each new land cell.
+
+        Returns:
+            list[int]: number of islands after each event.
+        """
+        add_land = self.add_land
+        return [add_land(r, c) for r, c in cells]
+
+
+def count_islands(cells, width: int) -> int:
+    """
+    Counts islands in a flat row major grid, non zero cells are land.
+
+    Works on bytes, bytearray, memoryview or a contiguous numpy array,
+    with no per cell Python objects and no recursion.
+    Time complexity: O(cells) in C plus O(runs) in Python
+    Space complexity: O(width)
+
+    Args:
+        cells: flat buffer of height * width cells.
+        width (int): number of columns.
+
+    Returns:
+        int: number of 4-connected islands.
+    """
+    if width <= 0:
+        return 0
+    return count_components(row_runs(cells, width))
+
+
+def _label_tile(name: str, width: int, r0: int, r1: int, c0: int, c1: int):
+    """
+    Pool worker: labels the components of one tile of the shared grid.
+
+    Returns the tile's component count and the component label (0 based,
+    -1 for water) found on its four edges: runs of the top and bottom
+    rows, and one label per row for the left and right columns.
+    """
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        buf = block.buf
+        tile_width = c1 - c0
+        parent = array("i")
+        previous = []
+        top = bottom = []
+        left = array("i", [-1]) * (r1 - r0)
+        right = array("i", [-1]) * (r1 - r0)
+        for r in range(r0, r1):
+            offset = r * width
+            runs = _land_runs(buf[offset + c0:offset + c1])
+            current, _ = _join_row(parent, previous, runs)
+            if current:
+                if current[0][0] == 0:
+                    left[r - r0] = current[0][2]
+                if current[-1][1] == tile_width:
+                    right[r - r0] = current[-1][2]
+            if r == r0:
+                top = current
+            previous = current
+        bottom = previous
+        del buf
+    finally:
+        block.close()
+
+    # Compact labels 0..count-1, one per root.
+    labels = {}
+    for run_id in range(len(parent)):
+        labels.setdefault(_find(parent, run_id), len(labels))
+
+    def label(run_id: int) -> int:
+        return -1 if run_id < 0 else labels[_find(parent, run_id)]
+
+    return (
+        len(labels),
+        [(start, stop, label(run_id)) for start, stop, run_id in top],
+        [(start, stop, label(run_id)) for start, stop, run_id in bottom],
+        array("i", map(label, left)),
+        array("i", map(label, right)),
+    )
+
+
+def count_islands_tiled(
+    cells,
+    width: int,
+    tile_rows: int = 1024,
+    tile_cols: int | None = None,
+    workers: int | None = None,
+) -> int:
+    """
+    count_islands across a process pool, same result as the serial count.
+
+    1. The grid goes to shared memory once and is cut into tiles of
+       tile_rows x tile_cols; each worker labels one tile.
+    2. Workers send back only their component count and the labels found
+       on the tile edges.
+    3. A global union-find over (tile, label) joins the labels of land
+       cells facing each other across a tile edge; every successful union
+       merges two tile components into one island.
+
+    Args:
+        cells: flat buffer of height * width cells, non zero is land.
+        width (int): number of columns.
+        tile_rows (int): rows per tile.
+        tile_cols (int | None): columns per tile, None for full width bands.
+        workers (int | None): pool size, defaults to os.cpu_count().
+
+    Returns:
+        int: number of 4-connected islands.
+    """
+    buf = _cell_buffer(cells)
+    if width <= 0 or len(buf) == 0:
+        return 0
+    if len(buf) % width:
+        raise ValueError(f"{len(buf)} cells is not a multiple of width {width}")
+    height = len(buf) // width
+    tile_cols = tile_cols or width
+    row_bounds = [(r, min(r + tile_rows, height)) for r in range(0, height, tile_rows)]
+    col_bounds = [(c, min(c + tile_cols, width)) for c in range(0, width, tile_cols)]
+
+    block = shared_memory.SharedMemory(create=True, size=len(buf))
+    try:
+        block.buf[:len(buf)] = buf
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            futures = [
+                [
+                    pool.submit(_label_tile, block.name, width, r0, r1, c0, c1)
+                    for c0, c1 in col_bounds
+                ]
+                for r0, r1 in row_bounds
+            ]
+            tiles = [[future.result() for future in row] for row in futures]
+    finally:
+        block.close()
+        block.unlink()
+
+    # Global ids: offset of each tile plus its local label.
+    offsets = []
+    total = 0
+    for row in tiles:
+        offsets.append([])
+        for tile in row:
+            offsets[-1].append(total)
+            total += tile[0]
+    parent = array("i", range(total))
+    count = total
+
+    def union(a: int, b: int) -> None:
+        nonlocal count
+        a = _find(parent, a)
+        b = _find(parent, b)
+        if a != b:
+            parent[max(a, b)] = min(a, b)
+            count -= 1
+
+    for i, row in enumerate(tiles):
+        for j, (_, top, bottom, left, right) in enumerate(row):
+            if j + 1 < len(row):
+                neighbour_left = row[j + 1][3]
+                for a, b in zip(right, neighbour_left):
+                    if a >= 0 and b >= 0:
+                        union(offsets[i][j] + a, offsets[i][j + 1] + b)
+            if i + 1 < len(tiles):
+                below = tiles[i + 1][j][1]
+                k = 0
+                for start, stop, a in bottom:
+                    while k < len(below) and below[k][1] <= start:
+                        k += 1
+                    m = k
+                    while m < len(below) and below[m][0] < stop:
+                        union(offsets[i][j] + a, offsets[i + 1][j] + below[m][2])
+                        m += 1
+    return count
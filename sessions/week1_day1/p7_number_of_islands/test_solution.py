@@ -1,4 +1,17 @@
-from solution import num_islands
+import sys
+from array import array
+
+import pytest
+
+from bitgrid import BitGrid
+from solution import (
+    IslandCounter,
+    IslandStats,
+    count_islands,
+    count_islands_tiled,
+    label_islands,
+    num_islands,
+)
 
 
 def test_three_islands():
@@ -44,3 +57,177 @@ def test_diagonal_not_connected():
 
 def test_empty_grid():
     assert num_islands([]) == 0
+
+
+def test_flat_buffers():
+    cells = bytes([1, 1, 0, 0, 1, 0, 1, 1, 0, 0, 0, 0])
+    assert count_islands(cells, 4) == 2
+    assert count_islands(bytearray(cells), 4) == 2
+    assert count_islands(memoryview(cells), 3) == 1
+    assert count_islands(b"", 4) == 0
+
+
+def test_flat_numpy():
+    np = pytest.importorskip("numpy")
+    grid = np.array([[1, 0, 1], [1, 0, 1], [1, 1, 1], [0, 0, 0], [1, 0, 1]], dtype=bool)
+    assert count_islands(grid, 3) == 3
+
+
+def test_flat_numpy_wide_dtype():
+    np = pytest.importorskip("numpy")
+    grid = np.array([[1, 0, 1], [1, 0, 1]], dtype=np.int64)
+    assert count_islands(grid, 3) == 2
+    assert count_islands_tiled(grid, 3, tile_rows=1, workers=1) == 2
+    count, labels, _ = label_islands(grid, 3)
+    assert (count, list(labels)) == (2, [1, 0, 2, 1, 0, 2])
+    assert count_islands(np.array([[1, 0], [0, 1]], dtype=np.uint8).T, 2) == 2
+
+
+def test_flat_wide_buffer_rejected():
+    with pytest.raises(ValueError):
+        count_islands(array("i", [1, 0, 1, 1]), 2)
+
+
+def test_flat_numpy_string_grid():
+    np = pytest.importorskip("numpy")
+    grid = np.array(GRID)
+    assert count_islands(grid, 5) == 3
+    assert count_islands(grid.astype("S1"), 5) == 3
+    corners = np.array([["1", "0", "1"], ["0", "0", "0"], ["1", "0", "1"]])
+    assert label_islands(corners, 3)[0] == 4
+    with pytest.raises(ValueError):
+        count_islands(np.array([[None, 1]], dtype=object), 2)
+
+
+def test_u_shape_merges_later():
+    grid = [
+        ["1", "0", "1", "0", "1"],
+        ["1", "0", "1", "0", "1"],
+        ["1", "1", "1", "1", "1"],
+    ]
+    assert num_islands(grid) == 1
+
+
+def test_long_snake_no_recursion():
+    width = 3
+    rows = 3 * sys.getrecursionlimit()
+    pattern = (["1", "1", "1"], ["0", "0", "1"], ["1", "1", "1"], ["1", "0", "0"])
+    grid = [list(pattern[r % 4]) for r in range(rows)]
+    assert num_islands(grid) == 1
+    assert count_islands(bytes(width * rows), width) == 0
+
+
+def _snake(rows: int, width: int) -> bytes:
+    """One island winding through every row, full rows joined at alternating ends."""
+    cells = bytearray(rows * width)
+    for r in range(rows):
+        if r % 2 == 0:
+            cells[r * width:(r + 1) * width] = b"\x01" * width
+        else:
+            cells[r * width + (width - 1 if r % 4 == 1 else 0)] = 1
+    return bytes(cells)
+
+
+@pytest.mark.parametrize(
+    "tile_rows, tile_cols", [(1, None), (3, 2), (4, 5), (100, 100)]
+)
+def test_tiled_matches_serial(tile_rows, tile_cols):
+    snake = _snake(21, 7)
+    assert count_islands_tiled(snake, 7, tile_rows, tile_cols, workers=2) == 1
+    cells = bytes([1, 1, 0, 0, 1, 0, 1, 1, 0, 1, 0, 1, 1, 0, 1, 0, 1, 1, 0, 0])
+    expected = count_islands(cells, 5)
+    assert count_islands_tiled(cells, 5, tile_rows, tile_cols, workers=2) == expected
+
+
+def test_tiled_empty():
+    assert count_islands_tiled(b"", 3) == 0
+
+
+@pytest.mark.parametrize("rows, cols", [(3, 3), (None, None)])
+def test_counter_add_land(rows, cols):
+    counter = IslandCounter(rows, cols)
+    assert counter.add_many([(0, 0), (0, 1), (1, 2), (2, 1)]) == [1, 1, 2, 3]
+    assert counter.add_land(1, 1) == 1
+    assert counter.add_land(1, 1) == 1
+
+
+def test_counter_matches_num_islands():
+    rows, cols = 4, 5
+    grid = [["0"] * cols for _ in range(rows)]
+    counter = IslandCounter(rows, cols)
+    for r, c in [(0, 0), (3, 4), (0, 2), (2, 2), (1, 2), (0, 1), (3, 3), (2, 4)]:
+        grid[r][c] = "1"
+        assert counter.add_land(r, c) == num_islands(grid)
+
+
+def test_counter_out_of_bounds():
+    with pytest.raises(IndexError):
+        IslandCounter(2, 2).add_land(2, 0)
+
+
+def test_label_islands():
+    cells = bytes([
+        1, 1, 0, 1,
+        1, 0, 0, 1,
+        0, 0, 1, 1,
+    ])
+    count, labels, stats = label_islands(cells, 4)
+    assert count == 2
+    assert list(labels) == [1, 1, 0, 2, 1, 0, 0, 2, 0, 0, 2, 2]
+    assert stats == [
+        IslandStats(area=3, perimeter=8, min_row=0, min_col=0, max_row=1, max_col=1),
+        IslandStats(area=4, perimeter=10, min_row=0, min_col=2, max_row=2, max_col=3),
+    ]
+
+
+def test_label_islands_merge_and_hole():
+    # A ring: two arms merge on the last row, the hole adds inner perimeter.
+    cells = bytes([
+        1, 1, 1,
+        1, 0, 1,
+        1, 1, 1,
+    ])
+    count, labels, stats = label_islands(cells, 3)
+    assert count == 1
+    assert list(labels) == [1, 1, 1, 1, 0, 1, 1, 1, 1]
+    assert stats == [
+        IslandStats(area=8, perimeter=16, min_row=0, min_col=0, max_row=2, max_col=2)
+    ]
+
+
+GRID = [
+    ["1", "1", "0", "0", "0"],
+    ["1", "1", "0", "0", "0"],
+    ["0", "0", "1", "0", "0"],
+    ["0", "0", "0", "1", "1"],
+]
+
+
+def test_bitgrid_from_lists():
+    bits = BitGrid.from_lists(GRID)
+    assert (bits.rows, bits.cols, bits.stride) == (4, 5, 8)
+    assert bits.to_lists() == GRID
+    assert bits[0, 1] == 1 and bits[2, 1] == 0
+    assert bits.count_islands() == num_islands(GRID) == 3
+
+
+def test_bitgrid_runs_cross_words():
+    row = ["0"] * 60 + ["1"] * 10 + ["0"] * 58 + ["1"] * 2
+    bits = BitGrid.from_lists([row, ["1"] * 130])
+    assert list(bits.row_runs()) == [[(60, 70), (128, 130)], [(0, 130)]]
+    assert bits.count_islands() == 1
+
+
+def test_bitgrid_text_and_mmap(tmp_path):
+    text = tmp_path / "grid.txt"
+    text.write_text("".join("".join(row) + "\n" for row in GRID), encoding="ascii")
+    bits = BitGrid.from_text(str(text))
+    assert bits.to_lists() == GRID
+    path = str(tmp_path / "grid.bin")
+    bits.save(path)
+    loaded = BitGrid.load(path)
+    try:
+        assert loaded.to_lists() == GRID
+        assert loaded.count_islands() == 3
+    finally:
+        loaded.close()
@@ -0,0 +1,52 @@
+"""
+Benchmark clone_graph: time and peak memory (tracemalloc) of the clone.
+
+Graphs are a ring plus random chords, about 4 neighbours per node.
+The same graphs as CSRGraph are timed too: copy() and a full BFS.
+Run: python bench_solution.py
+"""
+
+import random
+import time
+import tracemalloc
+
+from csr_graph import CSRGraph
+from solution import Node, clone_graph
+
+
+def make_graph(n: int) -> Node:
+    rng = random.Random(n)
+    nodes = [Node(i + 1) for i in range(n)]
+    for i in range(n):
+        for j in ((i + 1) % n, rng.randrange(n)):
+            nodes[i].neighbors.append(nodes[j])
+            nodes[j].neighbors.append(nodes[i])
+    return nodes[0]
+
+
+if __name__ == "__main__":
+    print(f"{'nodes':>9} {'seconds':>8} {'peak MiB':>9} {'bytes/node':>11}")
+    for n in (10**4, 10**5, 10**6):
+        graph = make_graph(n)
+        start = time.perf_counter()
+        clone_graph(graph)
+        seconds = time.perf_counter() - start
+        tracemalloc.start()
+        clone = clone_graph(graph)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del clone
+        print(f"{n:>9} {seconds:>8.2f} {peak / 2**20:>9.1f} {peak / n:>11.0f}")
+
+    print(f"\n{'nodes':>9} {'copy s':>8} {'bfs s':>8} {'bytes/node':>11}")
+    for n in (10**4, 10**5, 10**6):
+        graph = CSRGraph.from_node(make_graph(n))
+        start = time.perf_counter()
+        graph.copy()
+        copy_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        graph.bfs()
+        bfs_seconds = time.perf_counter() - start
+        print(
+            f"{n:>9} {copy_seconds:>8.4f} {bfs_seconds:>8.2f} {graph.nbytes / n:>11.0f}"
+        )
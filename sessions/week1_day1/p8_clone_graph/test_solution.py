@@ -1,4 +1,7 @@
-from solution import Node, clone_graph
+import sys
+
+from csr_graph import CSRGraph
+from solution import LazyNode, Node, clone_graph
 
 
 def _build_graph(adj_list: list[list[int]]) -> Node | None:
@@ -80,3 +83,89 @@ def test_two_nodes():
     assert len(cloned.neighbors) == 1
     assert cloned.neighbors[0].val == 2
     assert cloned.neighbors[0] is not n2
+
+
+def test_long_path_no_recursion():
+    n = 10 * sys.getrecursionlimit()
+    nodes = [Node(i) for i in range(n)]
+    for a, b in zip(nodes, nodes[1:]):
+        a.neighbors.append(b)
+        b.neighbors.append(a)
+    cloned = clone_graph(nodes[0])
+    assert _graph_to_adj(cloned) == _graph_to_adj(nodes[0])
+    assert _collect_nodes(nodes[0]).isdisjoint(_collect_nodes(cloned))
+
+
+def test_node_has_no_dict():
+    assert not hasattr(Node(1), "__dict__")
+
+
+def test_csr_round_trip():
+    original = _build_graph([[2, 4], [1, 3], [2, 4], [1, 3]])
+    graph = CSRGraph.from_node(original)
+    assert (len(graph), graph.num_edges) == (4, 8)
+    back = graph.to_node()
+    assert _graph_to_adj(back) == _graph_to_adj(original)
+    assert _collect_nodes(original).isdisjoint(_collect_nodes(back))
+
+
+def test_csr_copy_is_deep():
+    graph = CSRGraph.from_node(_build_graph([[2], [1, 3], [2]]))
+    copy = graph.copy()
+    copy.targets[0] = 2
+    assert graph.targets[0] == 1
+    assert list(copy.offsets) == list(graph.offsets)
+
+
+def test_csr_from_edges_and_traversals():
+    # 0 -> 1, 0 -> 2, 1 -> 3, 2 -> 3
+    graph = CSRGraph.from_edges(5, [(1, 3), (0, 1), (2, 3), (0, 2)])
+    assert list(graph.offsets) == [0, 2, 3, 4, 4, 4]
+    assert list(graph.neighbors(0)) == [1, 2]
+    assert list(graph.bfs(0)) == [0, 1, 2, 3]
+    assert list(graph.dfs(0)) == [0, 1, 3, 2]
+    assert list(graph.bfs(4)) == [4]
+
+
+def test_csr_empty():
+    assert CSRGraph.from_node(None).to_node() is None
+
+
+def test_lazy_clone_deep_copy():
+    original = _build_graph([[2, 4], [1, 3], [2, 4], [1, 3]])
+    cloned = clone_graph(original, lazy=True)
+    assert isinstance(cloned, LazyNode)
+    assert _graph_to_adj(cloned) == _graph_to_adj(original)
+    assert _collect_nodes(original).isdisjoint(_collect_nodes(cloned))
+
+
+def test_lazy_clone_only_visited_part():
+    nodes = [Node(i) for i in range(1000)]
+    for a, b in zip(nodes, nodes[1:]):
+        a.neighbors.append(b)
+        b.neighbors.append(a)
+    cloned = clone_graph(nodes[0], lazy=True)
+    assert cloned.neighbors[0].val == 1
+    # Node 0 and its neighbour exist, nothing further down the path.
+    assert len(cloned.neighbors[0]._clones) == 2
+
+
+def test_lazy_materialize():
+    original = _build_graph([[2, 3], [1, 3], [1, 2]])
+    cloned = clone_graph(original, lazy=True).materialize()
+    stack, seen = [cloned], set()
+    while stack:
+        node = stack.pop()
+        if id(node) not in seen:
+            seen.add(id(node))
+            assert node._original is None
+            stack.extend(node._neighbors)
+    assert len(seen) == 3
+    assert _graph_to_adj(cloned) == _graph_to_adj(original)
+
+
+def test_lazy_single_and_none():
+    assert clone_graph(None, lazy=True) is None
+    cloned = clone_graph(Node(1), lazy=True)
+    assert cloned.val == 1
+    assert cloned.neighbors == []
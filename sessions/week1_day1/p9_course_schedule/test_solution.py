@@ -1,4 +1,7 @@
-from solution import can_finish
+import pytest
+
+import solution
+from solution import IncrementalSchedule, can_finish
 
 
 def test_simple_chain():
@@ -32,3 +35,83 @@ def test_single_course():
 
 def test_self_loop():
     assert can_finish(1, [[0, 0]]) is False
+
+
+def _is_valid_order(order, num_courses, prerequisites):
+    position = {course: i for i, course in enumerate(order)}
+    return len(position) == num_courses and all(
+        position[b] < position[a] for a, b in prerequisites
+    )
+
+
+def test_order_diamond():
+    prerequisites = [[1, 0], [2, 0], [3, 1], [3, 2]]
+    order = can_finish(4, prerequisites, return_order=True)
+    assert list(order) == [0, 1, 2, 3]
+    assert _is_valid_order(order, 4, prerequisites)
+
+
+def test_order_cycle():
+    assert can_finish(3, [[0, 1], [1, 2], [2, 0]], return_order=True) is None
+
+
+def test_order_disconnected():
+    prerequisites = [[0, 4], [2, 1], [4, 3]]
+    order = can_finish(5, prerequisites, return_order=True)
+    assert _is_valid_order(order, 5, prerequisites)
+
+
+def test_numpy_build_matches(monkeypatch):
+    pytest.importorskip("numpy")
+    prerequisites = [[1, 0], [2, 0], [3, 1], [3, 2], [5, 4]]
+    expected = list(can_finish(6, prerequisites, return_order=True))
+    monkeypatch.setattr(solution, "NUMPY_MIN_EDGES", 0)
+    assert list(can_finish(6, prerequisites, return_order=True)) == expected
+    assert can_finish(3, [[0, 1], [1, 2], [2, 0]]) is False
+    assert can_finish(3, []) is True
+
+
+def test_numpy_array_input():
+    np = pytest.importorskip("numpy")
+    prerequisites = [[1, 0], [2, 0], [3, 1], [3, 2], [5, 4]]
+    expected = list(can_finish(6, prerequisites, return_order=True))
+    assert list(can_finish(6, np.array(prerequisites), return_order=True)) == expected
+    assert can_finish(3, np.array([[0, 1], [1, 2], [2, 0]])) is False
+    assert can_finish(3, np.empty((0, 2), dtype=np.int64)) is True
+
+
+def test_counting_order_two_digits():
+    np = pytest.importorskip("numpy")
+    keys = np.array([70000, 3, 65536, 3, 0, 131071], dtype=np.int32)
+    expected = np.argsort(keys, kind="stable").tolist()
+    assert solution._counting_order(keys).tolist() == expected
+
+
+def test_incremental_rejects_cycle():
+    schedule = IncrementalSchedule(3)
+    assert schedule.add_prerequisite(1, 0) is True
+    assert schedule.add_prerequisite(2, 1) is True
+    assert schedule.add_prerequisite(0, 2) is False
+    assert schedule.add_prerequisite(0, 0) is False
+    assert list(schedule.order()) == [0, 1, 2]
+
+
+def test_incremental_reorders_locally():
+    schedule = IncrementalSchedule(5)
+    prerequisites = [[0, 4], [2, 3], [1, 2], [3, 4]]
+    for course, before in prerequisites:
+        assert schedule.add_prerequisite(course, before) is True
+    assert _is_valid_order(schedule.order(), 5, prerequisites)
+    assert schedule.add_prerequisite(4, 1) is False
+    assert _is_valid_order(schedule.order(), 5, prerequisites)
+
+
+def test_incremental_matches_can_finish():
+    prerequisites = [[1, 0], [2, 0], [3, 1], [3, 2], [0, 3], [2, 1]]
+    schedule = IncrementalSchedule(4)
+    accepted = []
+    for course, before in prerequisites:
+        expected = can_finish(4, accepted + [[course, before]])
+        assert schedule.add_prerequisite(course, before) is expected
+        if expected:
+            accepted.append([course, before])